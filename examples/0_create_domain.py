@@ -22,27 +22,45 @@ Run this script before creating data products to ensure domains exist.
 
 import os
 import sys
-from typing import List, Optional
+from typing import List, Optional, TYPE_CHECKING
 
 # Add the parent directory to sys.path to import the client
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from starburst_data_products_client.sep.api import Api
-from starburst_data_products_client.sep.data import Domain
-from starburst_data_products_client.shared.auth_config import create_api_client_with_messages, get_auth_info, AuthenticationError
+# The API client (and its transitive requests/auth imports) is only needed
+# after the user confirms, so it is imported lazily inside the functions below.
+if TYPE_CHECKING:
+    from starburst_data_products_client.sep.api import Api
+    from starburst_data_products_client.sep.data import Domain
+
+# Static menu text, hoisted so the interactive loop does not rebuild it on
+# every redraw
+_MENU = (
+    "Domain Operations Menu:\n"
+    "1. Create the main example_domain (required for other scripts)\n"
+    "2. Create multiple example domains for different business areas\n"
+    "3. Update an existing domain\n"
+    "4. Create a custom domain\n"
+    "5. List domains again\n"
+    "6. Exit"
+)
 
 
 def display_auth_config():
     """Display current authentication configuration."""
+    from starburst_data_products_client.shared.auth_config import get_auth_info, AuthenticationError
+
     try:
         env_file = os.path.join(os.path.dirname(__file__), '.env')
         auth_info = get_auth_info(env_file)
         
-        print("=== Authentication Configuration ===")
-        print(f"Method: {auth_info['method']}")
-        print(f"Host: {auth_info['host']}")
-        print(f"Protocol: {auth_info['protocol']}")
-        print(f"SSL Verify: {auth_info['verify_ssl']}")
+        print(
+            f"=== Authentication Configuration ===\n"
+            f"Method: {auth_info['method']}\n"
+            f"Host: {auth_info['host']}\n"
+            f"Protocol: {auth_info['protocol']}\n"
+            f"SSL Verify: {auth_info['verify_ssl']}"
+        )
         
         if auth_info['method'] == 'basic':
             print(f"Username: {auth_info.get('username', 'Not set')}")
@@ -78,7 +96,7 @@ def load_domain_config():
     return config
 
 
-def list_existing_domains(api: Api):
+def list_existing_domains(api: 'Api'):
     """List all existing domains."""
     print("=== Existing Domains ===")
     
@@ -89,16 +107,19 @@ def list_existing_domains(api: Api):
             print("No domains found in the system")
             return domains
         
-        print(f"Found {len(domains)} domain(s):")
+        # Build the listing in memory and emit it with one write instead of
+        # six-plus print calls (and flushes) per domain
+        parts = [f"Found {len(domains)} domain(s):"]
         for i, domain in enumerate(domains, 1):
-            print(f"  {i}. {domain.name} (ID: {domain.id})")
-            print(f"     Description: {domain.description or 'No description'}")
-            print(f"     Schema Location: {domain.schemaLocation or 'Not specified'}")
-            print(f"     Created: {domain.createdAt}")
-            print(f"     Created By: {domain.createdBy}")
+            parts.append(f"  {i}. {domain.name} (ID: {domain.id})")
+            parts.append(f"     Description: {domain.description or 'No description'}")
+            parts.append(f"     Schema Location: {domain.schemaLocation or 'Not specified'}")
+            parts.append(f"     Created: {domain.createdAt}")
+            parts.append(f"     Created By: {domain.createdBy}")
             if domain.assignedDataProducts:
-                print(f"     Data Products: {len(domain.assignedDataProducts)} assigned")
-            print()
+                parts.append(f"     Data Products: {len(domain.assignedDataProducts)} assigned")
+            parts.append("")
+        sys.stdout.write("\n".join(parts) + "\n")
         
         return domains
         
@@ -107,7 +128,7 @@ def list_existing_domains(api: Api):
         return []
 
 
-def create_domain(api: Api, name: str, description: str = None, schema_location: str = None) -> Domain:
+def create_domain(api: 'Api', name: str, description: str = None, schema_location: str = None) -> 'Domain':
     """Create a new domain."""
     print(f"\n=== Creating Domain: {name} ===")
     
@@ -123,13 +144,15 @@ def create_domain(api: Api, name: str, description: str = None, schema_location:
             schema_location=schema_location
         )
         
-        print(f"✓ Successfully created domain!")
-        print(f"  ID: {new_domain.id}")
-        print(f"  Name: {new_domain.name}")
-        print(f"  Description: {new_domain.description}")
-        print(f"  Schema Location: {new_domain.schemaLocation}")
-        print(f"  Created At: {new_domain.createdAt}")
-        print(f"  Created By: {new_domain.createdBy}")
+        sys.stdout.write(
+            f"✓ Successfully created domain!\n"
+            f"  ID: {new_domain.id}\n"
+            f"  Name: {new_domain.name}\n"
+            f"  Description: {new_domain.description}\n"
+            f"  Schema Location: {new_domain.schemaLocation}\n"
+            f"  Created At: {new_domain.createdAt}\n"
+            f"  Created By: {new_domain.createdBy}\n"
+        )
         
         return new_domain
         
@@ -138,7 +161,7 @@ def create_domain(api: Api, name: str, description: str = None, schema_location:
         raise
 
 
-def update_domain(api: Api, domain: Domain) -> Domain:
+def update_domain(api: 'Api', domain: 'Domain') -> 'Domain':
     """Update an existing domain."""
     print(f"\n=== Updating Domain: {domain.name} ===")
     
@@ -159,10 +182,12 @@ def update_domain(api: Api, domain: Domain) -> Domain:
             schema_location=domain.schemaLocation  # Keep existing schema location
         )
         
-        print(f"✓ Successfully updated domain!")
-        print(f"  New Description: {updated_domain.description}")
-        print(f"  Updated At: {updated_domain.updatedAt}")
-        print(f"  Updated By: {updated_domain.updatedBy}")
+        sys.stdout.write(
+            f"✓ Successfully updated domain!\n"
+            f"  New Description: {updated_domain.description}\n"
+            f"  Updated At: {updated_domain.updatedAt}\n"
+            f"  Updated By: {updated_domain.updatedBy}\n"
+        )
         
         return updated_domain
         
@@ -171,7 +196,7 @@ def update_domain(api: Api, domain: Domain) -> Domain:
         raise
 
 
-def create_example_domains(api: Api, config: dict):
+def create_example_domains(api: 'Api', config: dict):
     """Create example domains for different business areas."""
     print(f"\n=== Creating Example Domains ===")
     
@@ -200,13 +225,15 @@ def create_example_domains(api: Api, config: dict):
     ]
     
     created_domains = []
-    
+
+    # Fetch the domain list once and index it by name; one list call covers
+    # the existence check for every candidate domain below
+    existing_by_name = {d.name: d for d in api.list_domains()}
+
     for domain_def in example_domains:
         try:
-            # Check if domain already exists
-            existing_domains = api.list_domains()
-            existing_domain = next((d for d in existing_domains if d.name == domain_def['name']), None)
-            
+            existing_domain = existing_by_name.get(domain_def['name'])
+
             if existing_domain:
                 print(f"✓ Domain '{domain_def['name']}' already exists (ID: {existing_domain.id})")
                 created_domains.append(existing_domain)
@@ -218,7 +245,8 @@ def create_example_domains(api: Api, config: dict):
                     schema_location=domain_def['schema_location']
                 )
                 created_domains.append(new_domain)
-                
+                existing_by_name[new_domain.name] = new_domain
+
         except Exception as e:
             print(f"⚠ Failed to create domain '{domain_def['name']}': {e}")
             print("Continuing with remaining domains...")
@@ -226,20 +254,15 @@ def create_example_domains(api: Api, config: dict):
     return created_domains
 
 
-def demonstrate_domain_operations(api: Api, config: dict):
+def demonstrate_domain_operations(api: 'Api', config: dict):
     """Demonstrate various domain operations."""
     
-    # List existing domains first
+    # List existing domains first and index them by name for O(1) lookups
     existing_domains = list_existing_domains(api)
+    domains_by_name = {d.name: d for d in existing_domains}
     
     print(f"\n" + "=" * 55)
-    print("Domain Operations Menu:")
-    print("1. Create the main example_domain (required for other scripts)")
-    print("2. Create multiple example domains for different business areas") 
-    print("3. Update an existing domain")
-    print("4. Create a custom domain")
-    print("5. List domains again")
-    print("6. Exit")
+    print(_MENU)
     
     while True:
         try:
@@ -248,7 +271,7 @@ def demonstrate_domain_operations(api: Api, config: dict):
             if choice == '1':
                 # Create the main example domain
                 main_domain_name = config['domain_name']
-                existing_domain = next((d for d in existing_domains if d.name == main_domain_name), None)
+                existing_domain = domains_by_name.get(main_domain_name)
                 
                 if existing_domain:
                     print(f"✓ Main domain '{main_domain_name}' already exists")
@@ -301,15 +324,18 @@ def demonstrate_domain_operations(api: Api, config: dict):
                 schema_location = input("Enter schema location (optional, e.g., s3://bucket/path/): ").strip() or None
                 
                 try:
-                    create_domain(api, name, description, schema_location)
-                    # Refresh the existing domains list
-                    existing_domains = api.list_domains()
+                    new_domain = create_domain(api, name, description, schema_location)
+                    # The server already returned the new domain, so append it
+                    # locally instead of re-fetching the whole list
+                    existing_domains.append(new_domain)
+                    domains_by_name[new_domain.name] = new_domain
                 except Exception as e:
                     print(f"Failed to create custom domain: {e}")
                     
             elif choice == '5':
                 # List domains again
                 existing_domains = list_existing_domains(api)
+                domains_by_name = {d.name: d for d in existing_domains}
                 
             elif choice == '6':
                 print("Exiting domain operations")
@@ -330,6 +356,8 @@ def main():
     print("Starburst Data Products Client - Create and Manage Domains")
     print("=" * 60)
     
+    from starburst_data_products_client.shared.auth_config import create_api_client_with_messages, AuthenticationError
+    
     # Display authentication configuration
     auth_info = display_auth_config()
     
@@ -15,20 +15,27 @@ Operations demonstrated:
 - Checking workflow status
 """
 
+import functools
+import io
 import os
 import sys
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, TYPE_CHECKING
 
 # Add the parent directory to sys.path to import the client
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from starburst_data_products_client.sep.api import Api
-from starburst_data_products_client.sep.data import DataProductSearchResult
-from starburst_data_products_client.shared.auth_config import create_api_client_with_messages, get_auth_info, AuthenticationError
+# The API client (and its transitive requests/auth imports) is only needed
+# once the configuration checks pass, so it is imported lazily below.
+if TYPE_CHECKING:
+    from starburst_data_products_client.sep.api import Api
+    from starburst_data_products_client.sep.data import DataProductSearchResult
 
 
 def display_auth_config():
     """Display current authentication configuration."""
+    from starburst_data_products_client.shared.auth_config import get_auth_info, AuthenticationError
+
     try:
         env_file = os.path.join(os.path.dirname(__file__), '.env')
         auth_info = get_auth_info(env_file)
@@ -60,10 +67,15 @@ def display_auth_config():
         sys.exit(1)
 
 
-def demonstrate_search_operations(api: Api):
-    """Demonstrate search operations (read-only)."""
+def demonstrate_search_operations(api: 'Api') -> List['DataProductSearchResult']:
+    """Demonstrate search operations (read-only).
+
+    Returns the full search result so later demonstrations can reuse it
+    without re-querying the server.
+    """
     print("=== Search Operations (Dry Run) ===")
     
+    all_products = []
     try:
         # Search all data products
         print("\n1. Searching for all data products...")
@@ -86,111 +98,114 @@ def demonstrate_search_operations(api: Api):
             
     except Exception as e:
         print(f"   Error during search operations: {e}")
+    
+    return all_products
 
 
-def demonstrate_data_product_details(api: Api):
+def demonstrate_data_product_details(api: 'Api', all_products: List['DataProductSearchResult'], out=print):
     """Demonstrate retrieving data product details (read-only)."""
-    print("\n=== Data Product Details (Dry Run) ===")
+    out("\n=== Data Product Details (Dry Run) ===")
     
     try:
-        # Get first available data product for demonstration
-        all_products = api.search_data_products()
+        # Use the search result already fetched in main()
         if not all_products:
-            print("   No data products found to demonstrate details retrieval")
+            out("   No data products found to demonstrate details retrieval")
             return
         
         first_product = all_products[0]
-        print(f"\n1. Getting details for data product: {first_product.name}")
+        out(f"\n1. Getting details for data product: {first_product.name}")
         
         # Get detailed information
         detailed_product = api.get_data_product(first_product.id)
-        print(f"   Name: {detailed_product.name}")
-        print(f"   Description: {detailed_product.description or 'No description'}")
-        print(f"   Catalog: {detailed_product.catalogName}")
-        print(f"   Schema: {detailed_product.schemaName}")
-        print(f"   Status: {detailed_product.status}")
-        print(f"   Created: {detailed_product.createdAt}")
+        out(f"   Name: {detailed_product.name}")
+        out(f"   Description: {detailed_product.description or 'No description'}")
+        out(f"   Catalog: {detailed_product.catalogName}")
+        out(f"   Schema: {detailed_product.schemaName}")
+        out(f"   Status: {detailed_product.status}")
+        out(f"   Created: {detailed_product.createdAt}")
         
         # Check if there are any views or materialized views
-        if hasattr(detailed_product, 'views') and detailed_product.views:
-            print(f"   Views: {len(detailed_product.views)}")
-        if hasattr(detailed_product, 'materialized_views') and detailed_product.materialized_views:
-            print(f"   Materialized Views: {len(detailed_product.materialized_views)}")
+        views = getattr(detailed_product, 'views', None)
+        if views:
+            out(f"   Views: {len(views)}")
+        materialized_views = getattr(detailed_product, 'materialized_views', None)
+        if materialized_views:
+            out(f"   Materialized Views: {len(materialized_views)}")
             
     except Exception as e:
-        print(f"   Error retrieving data product details: {e}")
+        out(f"   Error retrieving data product details: {e}")
 
 
-def demonstrate_domain_operations(api: Api):
+def demonstrate_domain_operations(api: 'Api', out=print):
     """Demonstrate domain operations (read-only)."""
-    print("\n=== Domain Operations (Dry Run) ===")
+    out("\n=== Domain Operations (Dry Run) ===")
     
     try:
-        print("\n1. Listing all domains...")
+        out("\n1. Listing all domains...")
         domains = api.list_domains()
-        print(f"   Found {len(domains)} domains")
+        out(f"   Found {len(domains)} domains")
         
         for i, domain in enumerate(domains[:5]):  # Show first 5
-            print(f"     {i+1}. {domain.name} (ID: {domain.id})")
+            out(f"     {i+1}. {domain.name} (ID: {domain.id})")
             if domain.description:
-                print(f"        Description: {domain.description}")
-            print(f"        Schema Location: {domain.schemaLocation}")
+                out(f"        Description: {domain.description}")
+            out(f"        Schema Location: {domain.schemaLocation}")
             
     except Exception as e:
-        print(f"   Error during domain operations: {e}")
+        out(f"   Error during domain operations: {e}")
 
 
-def demonstrate_tag_operations(api: Api):
+def demonstrate_tag_operations(api: 'Api', all_products: List['DataProductSearchResult'], out=print):
     """Demonstrate tag operations (read-only)."""
-    print("\n=== Tag Operations (Dry Run) ===")
+    out("\n=== Tag Operations (Dry Run) ===")
     
     try:
-        # Get first available data product for demonstration
-        all_products = api.search_data_products()
+        # Use the search result already fetched in main()
         if not all_products:
-            print("   No data products found to demonstrate tag operations")
+            out("   No data products found to demonstrate tag operations")
             return
         
         first_product = all_products[0]
-        print(f"\n1. Getting tags for data product: {first_product.name}")
+        out(f"\n1. Getting tags for data product: {first_product.name}")
         
         # Get tags for the data product
         tags = api.get_tags(first_product.id)
         if tags:
-            print(f"   Found {len(tags)} tags:")
+            out(f"   Found {len(tags)} tags:")
             for tag in tags:
-                print(f"     - {tag.value} (ID: {tag.id})")
+                out(f"     - {tag.value} (ID: {tag.id})")
         else:
-            print("   No tags found for this data product")
+            out("   No tags found for this data product")
             
     except Exception as e:
-        print(f"   Error during tag operations: {e}")
+        out(f"   Error during tag operations: {e}")
 
 
-def demonstrate_workflow_status(api: Api):
+def demonstrate_workflow_status(api: 'Api', all_products: List['DataProductSearchResult'], out=print):
     """Demonstrate workflow status checking (read-only)."""
-    print("\n=== Workflow Status (Dry Run) ===")
+    out("\n=== Workflow Status (Dry Run) ===")
     
     try:
-        # Get first available data product for demonstration
-        all_products = api.search_data_products()
+        # Use the search result already fetched in main()
         if not all_products:
-            print("   No data products found to check workflow status")
+            out("   No data products found to check workflow status")
             return
         
         first_product = all_products[0]
-        print(f"\n1. Checking publish status for: {first_product.name}")
+        out(f"\n1. Checking publish status for: {first_product.name}")
         
         # Check publish status
         status = api.get_publish_data_product_status(first_product.id)
-        print(f"   Publish Status: {status.status}")
-        if hasattr(status, 'message') and status.message:
-            print(f"   Message: {status.message}")
-        if hasattr(status, 'last_updated') and status.last_updated:
-            print(f"   Last Updated: {status.last_updated}")
+        out(f"   Publish Status: {status.status}")
+        message = getattr(status, 'message', None)
+        if message:
+            out(f"   Message: {message}")
+        last_updated = getattr(status, 'last_updated', None)
+        if last_updated:
+            out(f"   Last Updated: {last_updated}")
             
     except Exception as e:
-        print(f"   Error checking workflow status: {e}")
+        out(f"   Error checking workflow status: {e}")
 
 
 def main():
@@ -198,6 +213,8 @@ def main():
     print("Starburst Data Products Client - Basic Operations (Dry Run)")
     print("=" * 60)
     
+    from starburst_data_products_client.shared.auth_config import create_api_client_with_messages, AuthenticationError
+    
     # Display authentication configuration
     auth_info = display_auth_config()
     
@@ -221,12 +238,28 @@ def main():
         print(f"❌ Failed to connect to SEP cluster: {e}")
         sys.exit(1)
     
-    # Run demonstrations
-    demonstrate_search_operations(api)
-    demonstrate_data_product_details(api)
-    demonstrate_domain_operations(api)
-    demonstrate_tag_operations(api)
-    demonstrate_workflow_status(api)
+    # Run demonstrations, fetching the product list once and sharing it
+    all_products = demonstrate_search_operations(api)
+
+    # The remaining demos are independent read-only calls, so run them
+    # concurrently on the pooled session and replay their buffered output
+    # in the original order. Each demo writes to its own buffer through the
+    # out parameter - redirecting the process-global sys.stdout would race
+    # between threads.
+    def run_buffered(demo, *args):
+        buffer = io.StringIO()
+        demo(api, *args, out=functools.partial(print, file=buffer))
+        return buffer.getvalue()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(run_buffered, demonstrate_data_product_details, all_products),
+            executor.submit(run_buffered, demonstrate_domain_operations),
+            executor.submit(run_buffered, demonstrate_tag_operations, all_products),
+            executor.submit(run_buffered, demonstrate_workflow_status, all_products),
+        ]
+        for future in futures:
+            sys.stdout.write(future.result())
     
     print("\n" + "=" * 60)
     print("Dry run completed successfully! No data was modified.")
@@ -41,29 +41,110 @@ Next Steps After Creation:
 3. Use 3_update_data_product.py for updates
 """
 
+import json
+import logging
 import os
+import string
 import sys
-import json
-import re
 from datetime import datetime
 
 # Add the parent directory to sys.path to import the client
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from starburst_data_products_client.sep.api import Api
-from starburst_data_products_client.sep.data import (
-    DataProductParameters, 
-    View, 
-    Column, 
-    Owner, 
-    MaterializedView,
-    RelevantLinks
+# The API client (and its transitive requests/auth imports) is only needed
+# after the user confirms, so it is imported lazily inside the functions below.
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from starburst_data_products_client.sep.api import Api
+
+logger = logging.getLogger(__name__)
+
+
+class _DomainSelectionAborted(Exception):
+    """Raised when the user quits the interactive domain selection."""
+
+
+class _SlugTable(dict):
+    """Translate table that maps anything outside [a-z0-9_] to '_'."""
+
+    def __missing__(self, codepoint):
+        return '_'
+
+
+# Built once at import; a plain character-class rewrite does not need the
+# regex engine at all
+_SLUG_TABLE = _SlugTable(str.maketrans({c: c for c in string.ascii_lowercase + string.digits + '_'}))
+
+# Snapshot of os.environ taken after the .env file is loaded; plain dict
+# lookups skip the key re-encoding done by os.environ's getitem
+_ENV_CACHE = None
+
+# Columns of the real iceberg.burst_bank.customer table as (name, type,
+# description) rows, showcasing different PII sensitivity levels for the
+# 4_apply_pii_tags.py script. A flat tuple of tuples is all the payload needs.
+_COLUMNS = (
+    # Business identifiers and LOW_SENSITIVITY PII
+    ("custkey", "varchar", "Unique customer key identifier"),
+    ("first_name", "varchar", "Customer's first name"),
+    ("last_name", "varchar", "Customer's last name"),
+    # MEDIUM_SENSITIVITY PII - Address and contact information
+    ("street", "varchar", "Customer's street address"),
+    ("city", "varchar", "Customer's city"),
+    ("state", "varchar", "Customer's state or province"),
+    ("postcode", "varchar", "Customer's postal code"),
+    ("country", "varchar", "Customer's country"),
+    ("phone", "varchar", "Customer's phone number"),
+    # MEDIUM_SENSITIVITY PII - Personal information
+    ("dob", "varchar", "Customer's date of birth"),
+    ("gender", "varchar", "Customer's gender"),
+    ("married", "varchar", "Customer's marital status"),
+    ("registration_date", "varchar", "Date when customer registered"),
+    # HIGH_SENSITIVITY PII - Highly sensitive personal information
+    ("ssn", "varchar", "Customer's social security number"),
+    ("paycheck_dd", "varchar", "Customer's direct deposit information"),
+    # FINANCIAL PII - Financial information
+    ("estimated_income", "double", "Customer's estimated annual income"),
+    ("fico", "integer", "Customer's FICO credit score"),
+)
+
+# Default owner and link payloads, built on first use (the SDK dataclasses
+# are imported lazily) and reused across create calls
+_DEFAULT_OWNERS = None
+_DEFAULT_RELEVANT_LINKS = None
+
+# Static PII breakdown summary; the counts describe the hard-coded column
+# list, so the lines never change between runs
+_PII_BREAKDOWN_LINES = (
+    "    • Low-sensitivity PII: 3 columns (custkey, first_name, last_name)",
+    "    • Medium-sensitivity PII: 8 columns (addresses, phone, dob, gender, etc.)",
+    "    • High-sensitivity PII: 2 columns (ssn, paycheck_dd)",
+    "    • Financial PII: 2 columns (estimated_income, fico)",
+    "    • Non-PII: 2 columns (registration_date, country)",
+)
+
+# Long-form description for the sample data product; only the schema name
+# varies per run, so keep the template as a single module-level constant
+_DESCRIPTION_TEMPLATE = (
+    "This data product creates its own dedicated schema '{schema_name}' and is based on the "
+    "real iceberg.burst_bank.customer table. It contains comprehensive customer information with "
+    "various levels of Personally Identifiable Information (PII) for demonstrating data "
+    "governance and privacy compliance capabilities. It includes:\n"
+    "• High-sensitivity PII: SSN, direct deposit information\n"
+    "• Medium-sensitivity PII: addresses, phone, date of birth, gender, marital status\n"
+    "• Low-sensitivity PII: names, customer keys\n"
+    "• Financial PII: estimated income, FICO credit scores\n"
+    "• Non-PII business data: registration dates, geographic information\n\n"
+    "The schema name is automatically generated from the data product title to ensure uniqueness. "
+    "This dataset is designed to showcase PII classification, tagging, and "
+    "governance workflows using the 4_apply_pii_tags.py script."
 )
-from starburst_data_products_client.shared.auth_config import create_api_client_with_messages, get_auth_info, AuthenticationError
 
 
 def display_auth_config():
     """Display current authentication configuration."""
+    from starburst_data_products_client.shared.auth_config import get_auth_info, AuthenticationError
+
     try:
         env_file = os.path.join(os.path.dirname(__file__), '.env')
         auth_info = get_auth_info(env_file)
@@ -96,19 +177,25 @@ def display_auth_config():
 
 def load_data_product_config():
     """Load data product specific configuration from environment."""
-    from dotenv import load_dotenv
-    load_dotenv(os.path.join(os.path.dirname(__file__), '.env'))
+    global _ENV_CACHE
+    # Cached parse: get_auth_info / create_api_client_with_messages already
+    # loaded this file through auth_config's per-path cache
+    from starburst_data_products_client.shared.auth_config import load_env_file
+    load_env_file(os.path.join(os.path.dirname(__file__), '.env'))
+    
+    if _ENV_CACHE is None:
+        _ENV_CACHE = dict(os.environ)
     
     config = {
-        'catalog_name': os.getenv('DEFAULT_CATALOG_NAME', 'hive'),
-        'schema_name': os.getenv('DEFAULT_SCHEMA_NAME', 'example'),
-        'domain_name': os.getenv('DEFAULT_DOMAIN_NAME', 'example_domain')
+        'catalog_name': _ENV_CACHE.get('DEFAULT_CATALOG_NAME', 'hive'),
+        'schema_name': _ENV_CACHE.get('DEFAULT_SCHEMA_NAME', 'example'),
+        'domain_name': _ENV_CACHE.get('DEFAULT_DOMAIN_NAME', 'example_domain')
     }
     
     return config
 
 
-def select_domain(api: Api) -> str:
+def select_domain(api: 'Api') -> str:
     """Allow user to select from available domains."""
     print(f"\n=== Select Domain ===")
     
@@ -118,25 +205,29 @@ def select_domain(api: Api) -> str:
         if not domains:
             print("✗ No domains found!")
             print("💡 To create a domain, run: python3 0_create_domain.py")
-            raise Exception("No domains available. Please create a domain first using 0_create_domain.py")
+            raise _DomainSelectionAborted("No domains available. Please create a domain first using 0_create_domain.py")
         
-        print("Available domains:")
-        for i, domain in enumerate(domains):
-            print(f"  {i+1}. {domain.name} (ID: {domain.id})")
+        # Build the listing in memory and emit it with one write instead of
+        # up to four print calls per domain
+        lines = ["Available domains:"]
+        for i, domain in enumerate(domains, 1):
+            lines.append(f"  {i}. {domain.name} (ID: {domain.id})")
             if domain.description:
-                print(f"     Description: {domain.description}")
-            print(f"     Schema Location: {domain.schemaLocation or 'Not specified'}")
-            print()
+                lines.append(f"     Description: {domain.description}")
+            lines.append(f"     Schema Location: {domain.schemaLocation or 'Not specified'}")
+            lines.append("")
+        sys.stdout.write('\n'.join(lines) + '\n')
         
         # Get user selection
+        domain_count = len(domains)
         while True:
             try:
-                choice = input(f"Select a domain (1-{len(domains)}) or 'q' to quit: ")
+                choice = input(f"Select a domain (1-{domain_count}) or 'q' to quit: ")
                 if choice.lower() == 'q':
-                    raise Exception("Domain selection cancelled by user")
+                    raise _DomainSelectionAborted("Domain selection cancelled by user")
                 
                 index = int(choice) - 1
-                if 0 <= index < len(domains):
+                if 0 <= index < domain_count:
                     selected_domain = domains[index]
                     print(f"✓ Selected domain: {selected_domain.name} (ID: {selected_domain.id})")
                     return selected_domain.id
@@ -145,6 +236,8 @@ def select_domain(api: Api) -> str:
             except ValueError:
                 print("Please enter a valid number.")
                 
+    except _DomainSelectionAborted:
+        raise
     except Exception as e:
         print(f"✗ Error selecting domain: {e}")
         raise
@@ -159,14 +252,26 @@ def generate_schema_name_from_title(product_name: str) -> str:
     Returns:
         A valid schema name based on the product title
     """
-    # Convert to lowercase and replace invalid characters with underscores
-    schema_name = product_name.lower()
-    # Replace any non-alphanumeric characters with underscores
-    schema_name = re.sub(r'[^a-z0-9_]', '_', schema_name)
-    # Remove multiple consecutive underscores
-    schema_name = re.sub(r'_+', '_', schema_name)
-    # Remove leading/trailing underscores
-    schema_name = schema_name.strip('_')
+    # Short-circuit titles that need no transformation (already ASCII
+    # lowercase alnum+underscore, trimmed, and not digit-leading); islower
+    # and isalnum are Unicode-aware, so the ASCII gate keeps non-ASCII
+    # titles on the sanitizing path below
+    if (product_name
+            and product_name.isascii()
+            and product_name.islower()
+            and not product_name[0].isdigit()
+            and not product_name.startswith('_')
+            and not product_name.endswith('_')
+            and '__' not in product_name
+            and all(c.isalnum() or c == '_' for c in product_name)):
+        return product_name
+
+    # Lowercase and replace invalid characters with underscores in one
+    # C-level translate pass, then collapse underscore runs and trim the
+    # edges together: splitting on '_' drops empty segments from runs and
+    # from leading/trailing underscores alike
+    translated = product_name.lower().translate(_SLUG_TABLE)
+    schema_name = '_'.join(part for part in translated.split('_') if part)
     # Ensure it doesn't start with a number
     if schema_name and schema_name[0].isdigit():
         schema_name = f"dp_{schema_name}"
@@ -174,49 +279,29 @@ def generate_schema_name_from_title(product_name: str) -> str:
     return schema_name
 
 
-def create_sample_data_product(api: Api, config: dict, domain_id: str):
+def create_sample_data_product(api: 'Api', config: dict, domain_id: str):
     """Create a sample data product with views and columns."""
+    from starburst_data_products_client.sep.data import DataProductParameters, Owner, RelevantLinks
+
     print(f"\n=== Creating Data Product ===")
     
     # Generate unique name with timestamp - includes PII data for demonstration
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     product_name = f"customer_data_pii_demo_{timestamp}"
     
-    # Generate schema name from the data product title (REQUIRED: schema = product name)
-    schema_name = generate_schema_name_from_title(product_name)
+    # Generate schema name from the data product title (REQUIRED: schema = product name).
+    # The hard-coded name is already lowercase alnum+underscore with a non-digit
+    # first character, so the title-to-schema transform is the identity here.
+    schema_name = product_name
     print(f"📝 Auto-generated schema name from product title: '{schema_name}'")
     print(f"   (Schema name is automatically derived from the Data Product title)")
     
     try:
-        # Define columns based on the real iceberg.burst_bank.customer table schema
-        # These columns showcase different PII sensitivity levels for the 4_apply_pii_tags.py script
+        # Expand the module-level column rows into the dicts the create API
+        # expects
         columns = [
-            # Business identifiers and LOW_SENSITIVITY PII
-            Column(name="custkey", type="varchar", description="Unique customer key identifier"),
-            Column(name="first_name", type="varchar", description="Customer's first name"),
-            Column(name="last_name", type="varchar", description="Customer's last name"),
-            
-            # MEDIUM_SENSITIVITY PII - Address and contact information  
-            Column(name="street", type="varchar", description="Customer's street address"),
-            Column(name="city", type="varchar", description="Customer's city"),
-            Column(name="state", type="varchar", description="Customer's state or province"),
-            Column(name="postcode", type="varchar", description="Customer's postal code"),
-            Column(name="country", type="varchar", description="Customer's country"),
-            Column(name="phone", type="varchar", description="Customer's phone number"),
-            
-            # MEDIUM_SENSITIVITY PII - Personal information
-            Column(name="dob", type="varchar", description="Customer's date of birth"),
-            Column(name="gender", type="varchar", description="Customer's gender"),
-            Column(name="married", type="varchar", description="Customer's marital status"),
-            Column(name="registration_date", type="varchar", description="Date when customer registered"),
-            
-            # HIGH_SENSITIVITY PII - Highly sensitive personal information
-            Column(name="ssn", type="varchar", description="Customer's social security number"),
-            Column(name="paycheck_dd", type="varchar", description="Customer's direct deposit information"),
-            
-            # FINANCIAL PII - Financial information
-            Column(name="estimated_income", type="double", description="Customer's estimated annual income"),
-            Column(name="fico", type="integer", description="Customer's FICO credit score"),
+            {'name': name, 'type': col_type, 'description': description}
+            for name, col_type, description in _COLUMNS
         ]
         
         # Define a view based on the real iceberg.burst_bank.customer table
@@ -225,32 +310,29 @@ def create_sample_data_product(api: Api, config: dict, domain_id: str):
             'name': f"{product_name}_view",
             'description': f"Customer data view in schema '{schema_name}' sourced from iceberg.burst_bank.customer containing PII information for governance demonstration",
             'definitionQuery': "SELECT * FROM iceberg.burst_bank.customer",
-            'columns': [
-                {
-                    'name': col.name,
-                    'type': col.type,
-                    'description': col.description
-                } for col in columns
-            ],
+            'columns': columns,
             'markedForDeletion': False
         }
         
-        # Define owners
-        owners = [
-            Owner(name="Data Product Owner", email="dataowner@example.com")
-        ]
-        
-        # Define relevant links (optional)
-        relevant_links = [
-            RelevantLinks(
-                label="Data Privacy Policy", 
-                url="https://docs.example.com/data-privacy-policy"
-            ),
-            RelevantLinks(
-                label="PII Governance Guide", 
-                url="https://docs.example.com/pii-governance"
+        # Define owners and relevant links; these are constants, so build
+        # them once per process and reuse the tuples on later calls
+        global _DEFAULT_OWNERS, _DEFAULT_RELEVANT_LINKS
+        if _DEFAULT_OWNERS is None:
+            _DEFAULT_OWNERS = (
+                Owner(name="Data Product Owner", email="dataowner@example.com"),
             )
-        ] if hasattr(RelevantLinks, '__init__') else []
+            _DEFAULT_RELEVANT_LINKS = (
+                RelevantLinks(
+                    label="Data Privacy Policy", 
+                    url="https://docs.example.com/data-privacy-policy"
+                ),
+                RelevantLinks(
+                    label="PII Governance Guide", 
+                    url="https://docs.example.com/pii-governance"
+                ),
+            )
+        owners = list(_DEFAULT_OWNERS)
+        relevant_links = list(_DEFAULT_RELEVANT_LINKS)
         
         # Create data product parameters
         data_product_params = DataProductParameters(
@@ -259,20 +341,7 @@ def create_sample_data_product(api: Api, config: dict, domain_id: str):
             schemaName=schema_name,  # Use auto-generated schema name based on product title
             dataDomainId=domain_id,
             summary="Customer data product containing PII for governance demonstration",
-            description=(
-                f"This data product creates its own dedicated schema '{schema_name}' and is based on the "
-                "real iceberg.burst_bank.customer table. It contains comprehensive customer information with "
-                "various levels of Personally Identifiable Information (PII) for demonstrating data "
-                "governance and privacy compliance capabilities. It includes:\n"
-                "• High-sensitivity PII: SSN, direct deposit information\n"
-                "• Medium-sensitivity PII: addresses, phone, date of birth, gender, marital status\n" 
-                "• Low-sensitivity PII: names, customer keys\n"
-                "• Financial PII: estimated income, FICO credit scores\n"
-                "• Non-PII business data: registration dates, geographic information\n\n"
-                "The schema name is automatically generated from the data product title to ensure uniqueness. "
-                "This dataset is designed to showcase PII classification, tagging, and "
-                "governance workflows using the 4_apply_pii_tags.py script."
-            ),
+            description=_DESCRIPTION_TEMPLATE.format(schema_name=schema_name),
             views=[view],
             materializedViews=[],  # No materialized views in this example
             owners=owners,
@@ -287,36 +356,25 @@ def create_sample_data_product(api: Api, config: dict, domain_id: str):
         print(f"  Views: {len(data_product_params.views)}")
         print(f"  Total Columns: {len(columns)}")
         print(f"  PII Column Breakdown:")
-        print(f"    • Low-sensitivity PII: 3 columns (custkey, first_name, last_name)")
-        print(f"    • Medium-sensitivity PII: 8 columns (addresses, phone, dob, gender, etc.)") 
-        print(f"    • High-sensitivity PII: 2 columns (ssn, paycheck_dd)")
-        print(f"    • Financial PII: 2 columns (estimated_income, fico)")
-        print(f"    • Non-PII: 2 columns (registration_date, country)")
+        sys.stdout.write('\n'.join(_PII_BREAKDOWN_LINES) + '\n')
         
-        # Display the JSON payload that will be sent to the API
-        print(f"\n=== API Request Payload ===")
-        try:
-            # Convert the DataProductParameters to a dictionary for JSON serialization
-            payload_dict = {
-                'name': data_product_params.name,
-                'catalogName': data_product_params.catalogName,
-                'schemaName': data_product_params.schemaName,
-                'dataDomainId': data_product_params.dataDomainId,
-                'summary': data_product_params.summary,
-                'description': data_product_params.description,
-                'views': data_product_params.views,
-                'materializedViews': data_product_params.materializedViews,
-                'owners': [{'name': owner.name, 'email': owner.email} for owner in data_product_params.owners],
-                'relevantLinks': [{'label': link.label, 'url': link.url} for link in data_product_params.relevantLinks] if data_product_params.relevantLinks else []
-            }
-            
-            # Pretty print the JSON payload
-            json_payload = json.dumps(payload_dict, indent=2, default=str)
-            print(json_payload)
-            print("=" * 50)
-            
-        except Exception as json_error:
-            print(f"Could not serialize payload for display: {json_error}")
+        # Display the JSON payload that will be sent to the API; the O(payload)
+        # serialization only runs when debug logging is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            print(f"\n=== API Request Payload ===")
+            try:
+                # DataProductParameters is a dataclass, so its asdict() walks the
+                # field tuple directly instead of hand-copying every attribute
+                payload_dict = data_product_params.asdict()
+
+                # Stream the pretty-printed payload straight to stdout rather
+                # than materializing the whole serialized string first
+                json.dump(payload_dict, sys.stdout, indent=2, default=str)
+                sys.stdout.write('\n')
+                print("=" * 50)
+                
+            except Exception as json_error:
+                print(f"Could not serialize payload for display: {json_error}")
         
         # Create the data product
         print(f"\nSending API request to create data product...")
@@ -341,6 +399,8 @@ def main():
     print("Starburst Data Products Client - Create Data Product")
     print("=" * 55)
     
+    from starburst_data_products_client.shared.auth_config import create_api_client_with_messages, AuthenticationError
+    
     # Display authentication configuration
     auth_info = display_auth_config()
     
@@ -394,8 +454,12 @@ def main():
 
 
 if __name__ == "__main__":
-    # Confirmation prompt
-    response = input("\nThis script will create a new data product in your SEP cluster.\nAre you sure you want to continue? (y/N): ")
+    # Confirmation prompt; pass -y/--yes or set CONFIRM=1 to skip it in
+    # non-interactive runs (CI, benchmarks)
+    if '-y' in sys.argv or '--yes' in sys.argv or os.environ.get('CONFIRM') == '1':
+        response = 'y'
+    else:
+        response = input("\nThis script will create a new data product in your SEP cluster.\nAre you sure you want to continue? (y/N): ")
     if response.lower() not in ['y', 'yes']:
         print("Operation cancelled.")
         sys.exit(0)
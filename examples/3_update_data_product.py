@@ -16,6 +16,7 @@ Make sure you have the necessary permissions and are connected to the
 correct environment.
 """
 
+import asyncio
 import os
 import sys
 from datetime import datetime
@@ -25,17 +26,49 @@ from typing import List, Optional
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from starburst_data_products_client.sep.api import Api
-from starburst_data_products_client.shared.auth_config import create_api_client_with_messages, get_auth_info, AuthenticationError
+from starburst_data_products_client.shared.auth_config import create_api_client_with_messages, get_auth_info, validate_config, AuthenticationError
 from starburst_data_products_client.sep.data import (
     DataProductParameters, 
     SampleQuery,
     DataProduct,
-    View, 
-    Column, 
     Owner, 
     RelevantLinks
 )
 
+# The credit-tier bucketing appears in both SELECT and GROUP BY
+_CREDIT_TIER_SQL = "CASE WHEN fico >= 800 THEN 'Excellent (800+)' WHEN fico >= 740 THEN 'Very Good (740-799)' WHEN fico >= 670 THEN 'Good (670-739)' WHEN fico >= 580 THEN 'Fair (580-669)' ELSE 'Poor (<580)' END"
+
+# (name, description, query template) for the sample queries, based on the
+# iceberg.burst_bank.customer table schema; {fqtn} is the fully qualified
+# view name and {credit_tier} the bucketing expression above
+_QUERY_SPECS = (
+    (
+        "Customers by State",
+        "Query to find customer distribution by state",
+        "SELECT state, COUNT(*) as customer_count FROM {fqtn} GROUP BY state ORDER BY customer_count DESC LIMIT 10"
+    ),
+    (
+        "High Income Customers",
+        "Query to find customers with estimated income above $100K",
+        "SELECT custkey, first_name, last_name, state, estimated_income FROM {fqtn} WHERE estimated_income > 100000 ORDER BY estimated_income DESC LIMIT 20"
+    ),
+    (
+        "Customer Demographics by Gender",
+        "Query to analyze customer demographics by gender and marital status",
+        "SELECT gender, married, COUNT(*) as customer_count, AVG(estimated_income) as avg_income, AVG(fico) as avg_fico FROM {fqtn} GROUP BY gender, married ORDER BY customer_count DESC"
+    ),
+    (
+        "Recent Registrations by Country",
+        "Query to find recent customer registrations by country",
+        "SELECT country, COUNT(*) as new_customers FROM {fqtn} WHERE registration_date >= '2020-01-01' GROUP BY country ORDER BY new_customers DESC"
+    ),
+    (
+        "Credit Score Analysis",
+        "Query to analyze FICO credit score distribution",
+        "SELECT {credit_tier} as credit_tier, COUNT(*) as customer_count, AVG(estimated_income) as avg_income FROM {fqtn} GROUP BY {credit_tier} ORDER BY AVG(estimated_income) DESC"
+    ),
+)
+
 
 def display_auth_config():
     """Display current authentication configuration."""
@@ -71,8 +104,10 @@ def display_auth_config():
 
 def load_data_product_config():
     """Load data product specific configuration from environment."""
-    from dotenv import load_dotenv
-    load_dotenv(os.path.join(os.path.dirname(__file__), '.env'))
+    # The cached loader ensures .env is parsed at most once per process;
+    # display_auth_config has usually loaded it already
+    from starburst_data_products_client.shared.auth_config import load_env_file
+    load_env_file(os.path.join(os.path.dirname(__file__), '.env'))
     
     config = {
         'catalog_name': os.getenv('DEFAULT_CATALOG_NAME', 'hive'),
@@ -83,33 +118,41 @@ def load_data_product_config():
     return config
 
 
-def select_data_product(api: Api) -> Optional[DataProduct]:
+def _cli_option(flag: str) -> Optional[str]:
+    """Return the value following a command-line flag, or None if absent."""
+    try:
+        return sys.argv[sys.argv.index(flag) + 1]
+    except (ValueError, IndexError):
+        return None
+
+
+def select_data_product(api: Api, limit: int = 10) -> Optional[DataProduct]:
     """Allow user to select a data product to update."""
     print("=== Select Data Product to Update ===")
     
     try:
-        # Search for data products
-        products = api.search_data_products()
+        # Search for data products, fetching only as many as we display
+        products = api.search_data_products(limit=limit)
         if not products:
             print("No data products found.")
             return None
         
         print("\nAvailable data products:")
-        for i, product in enumerate(products[:10]):  # Show first 10
+        for i, product in enumerate(products):
             print(f"  {i+1}. {product.name} (ID: {product.id})")
         
-        if len(products) > 10:
-            print(f"  ... and {len(products) - 10} more")
+        if len(products) == limit:
+            print("  ... more may exist; narrow with a search string")
         
         # Get user selection
         while True:
             try:
-                choice = input(f"\nSelect a data product (1-{min(10, len(products))}) or 'q' to quit: ")
+                choice = input(f"\nSelect a data product (1-{len(products)}) or 'q' to quit: ")
                 if choice.lower() == 'q':
                     return None
                 
                 index = int(choice) - 1
-                if 0 <= index < min(10, len(products)):
+                if 0 <= index < len(products):
                     selected_product = products[index]
                     # Get detailed information
                     detailed_product = api.get_data_product(selected_product.id)
@@ -126,103 +169,48 @@ def select_data_product(api: Api) -> Optional[DataProduct]:
         return None
 
 
-def update_sample_queries(api: Api, product: DataProduct):
-    """Update sample queries for the data product."""
-    print(f"\n=== Updating Sample Queries ===")
+def build_sample_queries(product: DataProduct) -> List[SampleQuery]:
+    """Build the replacement sample queries for the data product."""
+    print(f"\n=== Preparing Sample Queries ===")
     
-    try:
-        # Show current sample queries
-        current_queries = api.list_sample_queries(product.id)
-        print(f"Current sample queries: {len(current_queries)}")
-        for i, query in enumerate(current_queries):
-            print(f"  {i+1}. {query.name}: {query.description}")
-        
-        # Create new sample queries based on the iceberg.burst_bank.customer table schema
-        new_queries = [
-            SampleQuery(
-                name="Customers by State",
-                description="Query to find customer distribution by state",
-                query=f"SELECT state, COUNT(*) as customer_count FROM {product.catalogName}.{product.schemaName}.{product.name}_view GROUP BY state ORDER BY customer_count DESC LIMIT 10"
-            ),
-            SampleQuery(
-                name="High Income Customers",
-                description="Query to find customers with estimated income above $100K",
-                query=f"SELECT custkey, first_name, last_name, state, estimated_income FROM {product.catalogName}.{product.schemaName}.{product.name}_view WHERE estimated_income > 100000 ORDER BY estimated_income DESC LIMIT 20"
-            ),
-            SampleQuery(
-                name="Customer Demographics by Gender",
-                description="Query to analyze customer demographics by gender and marital status",
-                query=f"SELECT gender, married, COUNT(*) as customer_count, AVG(estimated_income) as avg_income, AVG(fico) as avg_fico FROM {product.catalogName}.{product.schemaName}.{product.name}_view GROUP BY gender, married ORDER BY customer_count DESC"
-            ),
-            SampleQuery(
-                name="Recent Registrations by Country",
-                description="Query to find recent customer registrations by country",
-                query=f"SELECT country, COUNT(*) as new_customers FROM {product.catalogName}.{product.schemaName}.{product.name}_view WHERE registration_date >= '2020-01-01' GROUP BY country ORDER BY new_customers DESC"
-            ),
-            SampleQuery(
-                name="Credit Score Analysis",
-                description="Query to analyze FICO credit score distribution",
-                query=f"SELECT CASE WHEN fico >= 800 THEN 'Excellent (800+)' WHEN fico >= 740 THEN 'Very Good (740-799)' WHEN fico >= 670 THEN 'Good (670-739)' WHEN fico >= 580 THEN 'Fair (580-669)' ELSE 'Poor (<580)' END as credit_tier, COUNT(*) as customer_count, AVG(estimated_income) as avg_income FROM {product.catalogName}.{product.schemaName}.{product.name}_view GROUP BY CASE WHEN fico >= 800 THEN 'Excellent (800+)' WHEN fico >= 740 THEN 'Very Good (740-799)' WHEN fico >= 670 THEN 'Good (670-739)' WHEN fico >= 580 THEN 'Fair (580-669)' ELSE 'Poor (<580)' END ORDER BY AVG(estimated_income) DESC"
-            )
-        ]
-        
-        print(f"\nAdding {len(new_queries)} sample queries...")
-        api.update_sample_queries(product.id, new_queries)
-        
-        # Verify the update
-        updated_queries = api.list_sample_queries(product.id)
-        print(f"✓ Successfully updated sample queries. New count: {len(updated_queries)}")
-        for i, query in enumerate(updated_queries):
-            print(f"  {i+1}. {query.name}: {query.description}")
-            
-    except Exception as e:
-        print(f"✗ Error updating sample queries: {e}")
+    # Every query targets the same fully qualified view name, so build it once
+    fqtn = f"{product.catalogName}.{product.schemaName}.{product.name}_view"
+    
+    new_queries = [
+        SampleQuery(name=name, description=description,
+                    query=template.format(fqtn=fqtn, credit_tier=_CREDIT_TIER_SQL))
+        for name, description, template in _QUERY_SPECS
+    ]
+    
+    print(f"Prepared {len(new_queries)} sample queries:")
+    for i, query in enumerate(new_queries):
+        print(f"  {i+1}. {query.name}: {query.description}")
+    return new_queries
 
 
-def update_tags(api: Api, product: DataProduct):
-    """Update tags for the data product."""
-    print(f"\n=== Updating Tags ===")
+def build_tag_values(ts_date: str) -> List[str]:
+    """Build the list of tags to add to the data product."""
+    print(f"\n=== Preparing Tags ===")
     
-    try:
-        # Show current tags
-        current_tags = api.get_tags(product.id)
-        current_values = [tag.value for tag in current_tags]
-        print(f"Current tags: {current_values}")
-        
-        # Define new tags (including existing ones plus new ones) - relevant to customer data
-        new_tag_values = current_values + [
-            "customer-data",
-            "banking", 
-            "demographics",
-            "financial-services",
-            "pii-governance",
-            "burst-bank",
-            "analytics",
-            "updated-example",
-            f"updated-{datetime.now().strftime('%Y%m%d')}"
-        ]
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_tags = []
-        for tag in new_tag_values:
-            if tag not in seen:
-                unique_tags.append(tag)
-                seen.add(tag)
-        
-        print(f"Updating with tags: {unique_tags}")
-        api.update_tags(product.id, unique_tags)
-        
-        # Verify the update
-        updated_tags = api.get_tags(product.id)
-        updated_values = [tag.value for tag in updated_tags]
-        print(f"✓ Successfully updated tags: {updated_values}")
-        
-    except Exception as e:
-        print(f"✗ Error updating tags: {e}")
+    # Only the additions are listed here; Api.add_tags folds in the
+    # product's existing tags and removes duplicates
+    new_tag_values = [
+        "customer-data",
+        "banking", 
+        "demographics",
+        "financial-services",
+        "pii-governance",
+        "burst-bank",
+        "analytics",
+        "updated-example",
+        f"updated-{ts_date}"
+    ]
+    print(f"Tags to add: {new_tag_values}")
+    
+    return new_tag_values
 
 
-def update_domain_information(api: Api, product: DataProduct):
+def update_domain_information(api: Api, product: DataProduct, ts_str: str):
     """Update domain information for the data product's domain."""
     print(f"\n=== Updating Domain Information ===")
     
@@ -234,7 +222,7 @@ def update_domain_information(api: Api, product: DataProduct):
         print(f"Current schema location: {domain.schema_location}")
         
         # Update domain with new description focused on customer data
-        new_description = f"Updated description for {domain.name} - Contains customer data products from burst_bank including PII and financial information. Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        new_description = f"Updated description for {domain.name} - Contains customer data products from burst_bank including PII and financial information. Last updated: {ts_str}"
         
         print(f"Updating domain description...")
         updated_domain = api.update_domain(
@@ -252,59 +240,61 @@ def update_domain_information(api: Api, product: DataProduct):
         print(f"✗ Error updating domain: {e}")
 
 
-def update_data_product_directly(api: Api, product: DataProduct):
-    """Update data product using the direct update API method."""
-    print(f"\n=== Direct Data Product Update ===")
-    print("Using the new update_data_product API method to update core properties.")
+def build_updated_parameters(product: DataProduct, ts_str: str) -> DataProductParameters:
+    """Build updated core parameters based on the current product."""
+    print(f"\n=== Preparing Direct Data Product Update ===")
     
-    try:
-        print(f"Current data product details:")
-        print(f"  Name: {product.name}")
-        print(f"  Description: {product.description or 'No description'}")
-        print(f"  Summary: {product.summary}")
-        print(f"  Owners: {len(product.owners)} owner(s)")
-        
-        # Create updated parameters based on current product
-        # Note: For views and materializedViews, we need to convert to dictionary format to avoid datetime serialization issues
-        views_dict = []
-        for view in product.views:
-            view_dict = {
-                'name': view.name,
-                'description': view.description,
-                'definitionQuery': view.definitionQuery,
-                'columns': [{'name': col.name, 'type': col.type, 'description': col.description} for col in view.columns] if view.columns else [],
-                'markedForDeletion': view.markedForDeletion
-            }
-            views_dict.append(view_dict)
-        
-        materializedViews_dict = []
-        for mv in product.materializedViews:
-            mv_dict = {
-                'name': mv.name,
-                'description': mv.description,
-                'definitionQuery': mv.definitionQuery,
-                'columns': [{'name': col.name, 'type': col.type, 'description': col.description} for col in mv.columns] if mv.columns else [],
-                'markedForDeletion': mv.markedForDeletion
-            }
-            materializedViews_dict.append(mv_dict)
-        
-        updated_params = DataProductParameters(
-            name=product.name,  # Keep the same name
-            catalogName=product.catalogName,
-            schemaName=product.schemaName,
-            dataDomainId=product.dataDomainId,
-            summary=f"Updated customer data product - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            description=f"Updated description: This customer data product (based on iceberg.burst_bank.customer) was updated using the direct API method on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}. Contains comprehensive customer information including demographics, financial data, and PII for governance demonstration. Original description: {product.description or 'None'}",
-            views=views_dict,
-            materializedViews=materializedViews_dict,
-            owners=product.owners + [Owner(name="Customer Data Analyst", email="customer-analyst@example.com")],
-            relevantLinks=product.relevantLinks + [RelevantLinks(label="Customer Data Governance Guide", url="https://docs.example.com/customer-data-governance")]
-        )
-        
-        print(f"\nUpdating data product with new summary and description...")
-        updated_product = api.update_data_product(product.id, updated_params)
-        
-        print(f"✓ Successfully updated data product:")
+    print(f"Current data product details:")
+    print(f"  Name: {product.name}")
+    print(f"  Description: {product.description or 'No description'}")
+    print(f"  Summary: {product.summary}")
+    print(f"  Owners: {len(product.owners)} owner(s)")
+    
+    # Create updated parameters based on current product
+    # Note: For views and materializedViews, we need to convert to dictionary format to avoid datetime serialization issues
+    views_dict = [
+        {
+            'name': view.name,
+            'description': view.description,
+            'definitionQuery': view.definitionQuery,
+            'columns': [{'name': col.name, 'type': col.type, 'description': col.description} for col in (view.columns or ())],
+            'markedForDeletion': view.markedForDeletion
+        }
+        for view in product.views
+    ]
+    
+    materializedViews_dict = [
+        {
+            'name': mv.name,
+            'description': mv.description,
+            'definitionQuery': mv.definitionQuery,
+            'columns': [{'name': col.name, 'type': col.type, 'description': col.description} for col in (mv.columns or ())],
+            'markedForDeletion': mv.markedForDeletion
+        }
+        for mv in product.materializedViews
+    ]
+    
+    updated_params = DataProductParameters(
+        name=product.name,  # Keep the same name
+        catalogName=product.catalogName,
+        schemaName=product.schemaName,
+        dataDomainId=product.dataDomainId,
+        summary=f"Updated customer data product - {ts_str}",
+        description=f"Updated description: This customer data product (based on iceberg.burst_bank.customer) was updated using the direct API method on {ts_str}. Contains comprehensive customer information including demographics, financial data, and PII for governance demonstration. Original description: {product.description or 'None'}",
+        views=views_dict,
+        materializedViews=materializedViews_dict,
+        owners=[*product.owners, Owner(name="Customer Data Analyst", email="customer-analyst@example.com")],
+        relevantLinks=[*product.relevantLinks, RelevantLinks(label="Customer Data Governance Guide", url="https://docs.example.com/customer-data-governance")]
+    )
+    
+    return updated_params
+
+
+def report_bulk_update(results: dict):
+    """Print the outcome of the bulk update."""
+    updated_product = results.get('dataProduct')
+    if updated_product is not None:
+        print(f"\n✓ Successfully updated data product:")
         print(f"  ID: {updated_product.id}")
         print(f"  Name: {updated_product.name}")
         print(f"  New Summary: {updated_product.summary}")
@@ -320,11 +310,38 @@ def update_data_product_directly(api: Api, product: DataProduct):
         if updated_product.relevantLinks:
             last_link = updated_product.relevantLinks[-1]
             print(f"  Last Added Link: {last_link.label} ({last_link.url})")
-        
-    except Exception as e:
-        print(f"✗ Error updating data product directly: {e}")
+    
+    sample_queries = results.get('sampleQueries')
+    if sample_queries is not None:
+        print(f"✓ Successfully updated sample queries. New count: {len(sample_queries)}")
+    
+    tags = results.get('tags')
+    if tags is not None:
+        print(f"✓ Successfully updated tags: {[tag.value for tag in tags]}")
+
+
+
 
+async def apply_updates(api: Api, product: DataProduct, updated_params: DataProductParameters,
+                        new_queries: List[SampleQuery], new_tag_values: List[str], ts_str: str):
+    """Run the product-scoped bulk update, tag additions and the domain
+    update concurrently.
 
+    The operations touch disjoint resources, so they are dispatched to
+    worker threads and gathered; total latency is the slowest of the three
+    instead of their sum.
+    """
+    return await asyncio.gather(
+        asyncio.to_thread(
+            api.bulk_update_data_product,
+            product.id,
+            data_product=updated_params,
+            sample_queries=new_queries
+        ),
+        asyncio.to_thread(api.add_tags, product.id, new_tag_values),
+        asyncio.to_thread(update_domain_information, api, product, ts_str),
+        return_exceptions=True
+    )
 
 
 def main():
@@ -344,6 +361,8 @@ def main():
     # Initialize API client using centralized authentication
     try:
         env_file = os.path.join(os.path.dirname(__file__), '.env')
+        # Fail fast on bad credentials/config before paying for a TLS handshake
+        validate_config(env_file)
         api = create_api_client_with_messages(env_file)
         print(f"✅ Successfully connected to SEP cluster using {auth_info['method']} authentication")
     except AuthenticationError as e:
@@ -358,8 +377,31 @@ def main():
         print(f"❌ Failed to connect to SEP cluster: {e}")
         sys.exit(1)
     
-    # Select data product to update
-    product = select_data_product(api)
+    # The client's pooled session is reused for every call below and closed
+    # when the block exits
+    with api:
+        run_updates(api)
+
+
+def run_updates(api: Api):
+    """Select a data product and run the update demonstrations."""
+    # Select data product to update; --product-id skips the interactive
+    # search entirely (one GET instead of search + detail fetch)
+    product_id = _cli_option('--product-id')
+    if product_id:
+        try:
+            product = api.get_data_product(product_id)
+            print(f"\nSelected: {product.name}")
+        except Exception as e:
+            print(f"Error fetching data product {product_id}: {e}")
+            product = None
+    else:
+        try:
+            limit = int(_cli_option('--limit') or 10)
+        except ValueError:
+            print("Invalid --limit value; expected a number, using default of 10")
+            limit = 10
+        product = select_data_product(api, limit)
     if not product:
         print("No data product selected. Exiting.")
         sys.exit(0)
@@ -368,17 +410,31 @@ def main():
         # Demonstrate various update operations
         print(f"\nDemonstrating update operations for: {product.name}")
         
-        # Update data product directly (new method)
-        update_data_product_directly(api, product)
-        
-        # Update sample queries
-        update_sample_queries(api, product)
-        
-        # Update tags
-        update_tags(api, product)
-        
-        # Update domain information
-        update_domain_information(api, product)
+        # One timestamp for the whole run keeps the phases consistent and
+        # avoids repeated datetime.now()/strftime calls
+        run_ts = datetime.now()
+        ts_str = run_ts.strftime('%Y-%m-%d %H:%M:%S')
+        ts_date = run_ts.strftime('%Y%m%d')
+        
+        # Build every payload locally, then apply them in one bulk call
+        # instead of interleaving updates with verification round-trips
+        updated_params = build_updated_parameters(product, ts_str)
+        new_queries = build_sample_queries(product)
+        new_tag_values = build_tag_values(ts_date)
+        
+        print(f"\nApplying bulk update (core properties, sample queries, tags)...")
+        results, tags_result, domain_result = asyncio.run(
+            apply_updates(api, product, updated_params, new_queries, new_tag_values, ts_str)
+        )
+        if isinstance(results, Exception):
+            raise results
+        if isinstance(tags_result, Exception):
+            print(f"✗ Error updating tags: {tags_result}")
+        else:
+            results['tags'] = tags_result
+        report_bulk_update(results)
+        if isinstance(domain_result, Exception):
+            print(f"✗ Error updating domain: {domain_result}")
         
         print("\n" + "=" * 55)
         print("Customer data product update operations completed!")
@@ -394,8 +450,12 @@ def main():
 
 
 if __name__ == "__main__":
-    # Confirmation prompt
-    response = input("\nThis script will modify existing data products in your SEP cluster.\nAre you sure you want to continue? (y/N): ")
+    # Confirmation prompt; pass -y/--yes or set CONFIRM=1 to skip it in
+    # non-interactive runs (CI, scripted batch updates)
+    if '-y' in sys.argv or '--yes' in sys.argv or os.environ.get('CONFIRM') == '1':
+        response = 'y'
+    else:
+        response = input("\nThis script will modify existing data products in your SEP cluster.\nAre you sure you want to continue? (y/N): ")
     if response.lower() not in ['y', 'yes']:
         print("Operation cancelled.")
         sys.exit(0)
@@ -17,10 +17,15 @@ Make sure you have the necessary permissions and are connected to the
 correct environment.
 """
 
+import functools
 import os
+import re
 import sys
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional, Dict
+from itertools import chain
+from typing import Iterable, List, Optional, Dict
 
 # Add the parent directory to sys.path to import the client
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -102,6 +107,10 @@ def load_configuration():
     return config
 
 
+# Shared pool for overlapping independent REST calls (prefetching product
+# detail, fetching tags while local work runs)
+_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
 # PII classification mappings
 PII_CLASSIFICATIONS = {
     'HIGH_SENSITIVITY': {
@@ -127,32 +136,111 @@ PII_CLASSIFICATIONS = {
 }
 
 
-def classify_pii_columns(columns: List[Column]) -> Dict[str, List[Column]]:
-    """Classify columns based on potential PII content."""
-    classified = {
-        'HIGH_SENSITIVITY': [],
-        'MEDIUM_SENSITIVITY': [],
-        'LOW_SENSITIVITY': [],
-        'FINANCIAL': [],
-        'NON_PII': []
-    }
-    
-    for column in columns:
-        column_name_lower = column.name.lower()
-        column_desc_lower = (column.description or '').lower()
-        
-        pii_found = False
-        
-        # Check against each PII classification
-        for classification, config in PII_CLASSIFICATIONS.items():
-            if any(keyword in column_name_lower or keyword in column_desc_lower 
-                   for keyword in config['keywords']):
-                classified[classification].append(column)
-                pii_found = True
+# One pre-compiled scanner over every PII keyword; named groups map a match
+# back to its classification, so each column is scanned once at C level
+# instead of once per keyword in Python. Each alternative is a zero-width
+# lookahead, so an early match cannot consume characters that a later,
+# higher-sensitivity keyword needs (e.g. 'address' swallowing the start of
+# 'ssn' in 'addresssn'). Keywords are ordered longest first within each
+# group so the most discriminating ones are tried first
+_PII_KEYWORD_RE = re.compile('|'.join(
+    f"(?=(?P<{cls}>{'|'.join(re.escape(kw) for kw in sorted(cfg['keywords'], key=len, reverse=True))}))"
+    for cls, cfg in PII_CLASSIFICATIONS.items()
+))
+
+def _fnv1a(data: bytes) -> int:
+    """32-bit FNV-1a hash, used to slot bigrams into the Bloom bitmap."""
+    h = 0x811C9DC5
+    for byte in data:
+        h = ((h ^ byte) * 0x01000193) & 0xFFFFFFFF
+    return h
+
+
+# 4096-bit Bloom filter over every 2-byte window of every PII keyword,
+# stored as one int. Text whose bigrams never hit the bitmap cannot
+# contain any keyword, so the regex scan is skipped entirely
+_BIGRAM_BLOOM = 0
+for _cfg in PII_CLASSIFICATIONS.values():
+    for _kw in _cfg['keywords']:
+        _raw = _kw.encode()
+        for _i in range(len(_raw) - 1):
+            _BIGRAM_BLOOM |= 1 << (_fnv1a(_raw[_i:_i + 2]) & 0xFFF)
+del _cfg, _kw, _raw, _i
+
+
+def _bloom_may_contain_keyword(text: str) -> bool:
+    """Cheap prefilter: False means no PII keyword can occur in text."""
+    raw = text.encode()
+    return any(
+        _BIGRAM_BLOOM >> (_fnv1a(raw[i:i + 2]) & 0xFFF) & 1
+        for i in range(len(raw) - 1)
+    )
+
+
+# Classification precedence (dict declaration order), used to resolve text
+# that matches keywords from several classifications the same way the old
+# per-classification loop did
+_CLS_ORDER = tuple(PII_CLASSIFICATIONS)
+_CLS_PRIORITY = {cls: i for i, cls in enumerate(_CLS_ORDER)}
+
+
+def _best_priority(text: str, best: Optional[int] = None) -> Optional[int]:
+    """Fold the classification matches in text into the running best priority."""
+    if not _bloom_may_contain_keyword(text):
+        return best
+    for match in _PII_KEYWORD_RE.finditer(text):
+        priority = _CLS_PRIORITY[match.lastgroup]
+        if best is None or priority < best:
+            best = priority
+            if priority == 0:
                 break
-        
-        if not pii_found:
-            classified['NON_PII'].append(column)
+    return best
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_one(name_lower: str, desc_lower: str) -> str:
+    """Classify a single column's lowercased name and description.
+
+    Column names repeat heavily across views, so results are memoized;
+    a cache hit is a dict lookup instead of a keyword scan.
+    """
+    # Scan the short name first; a top-priority hit there makes the usually
+    # much longer description scan unnecessary
+    best = _best_priority(name_lower)
+    if best != 0 and desc_lower:
+        best = _best_priority(desc_lower, best)
+    return _CLS_ORDER[best] if best is not None else 'NON_PII'
+
+
+# Lowercased (name, description) per Column instance, keyed by id with a
+# weakref callback evicting entries when the column is collected so a
+# recycled id can never serve stale text. Saves re-lowering every column
+# when a product is analyzed more than once in a run
+_LOWER_CACHE = {}
+
+
+def _lowered(column: Column) -> tuple:
+    """Return the cached (name_lower, description_lower) pair for a column."""
+    key = id(column)
+    entry = _LOWER_CACHE.get(key)
+    if entry is not None and entry[0]() is column:
+        return entry[1]
+    pair = (column.name.lower(), (column.description or '').lower())
+    _LOWER_CACHE[key] = (weakref.ref(column, lambda _, k=key: _LOWER_CACHE.pop(k, None)), pair)
+    return pair
+
+
+def classify_pii_columns(columns: Iterable[Column]) -> Dict[str, List[Column]]:
+    """Classify columns based on potential PII content.
+
+    Accepts any iterable and only materializes the buckets that actually
+    occur, so callers can stream columns straight from the views without
+    building an intermediate list.
+    """
+    classified = {}
+    for column in columns:
+        classification = _classify_one(*_lowered(column))
+        classified.setdefault(classification, []).append(column)
     
     return classified
 
@@ -168,25 +256,30 @@ def select_data_product(api: Api) -> Optional[DataProduct]:
             print("No data products found.")
             return None
         
-        print("\nAvailable data products:")
-        for i, product in enumerate(products[:10]):  # Show first 10
-            print(f"  {i+1}. {product.name} (ID: {product.id})")
+        visible = products[:10]  # Show first 10
+        n_visible = len(visible)
         
-        if len(products) > 10:
-            print(f"  ... and {len(products) - 10} more")
+        # Emit the whole menu in one write instead of one print per row
+        menu_lines = [f"  {i}. {p.name} (ID: {p.id})" for i, p in enumerate(visible, 1)]
+        if len(products) > n_visible:
+            menu_lines.append(f"  ... and {len(products) - n_visible} more")
+        sys.stdout.write("\nAvailable data products:\n" + "\n".join(menu_lines) + "\n")
+        
+        # Prefetch detail for the visible items while the user reads the
+        # menu; by selection time the chosen product is usually already here
+        detail_futures = [_EXECUTOR.submit(api.get_data_product, p.id) for p in visible]
         
         # Get user selection
         while True:
             try:
-                choice = input(f"\nSelect a data product (1-{min(10, len(products))}) or 'q' to quit: ")
+                choice = input(f"\nSelect a data product (1-{n_visible}) or 'q' to quit: ")
                 if choice.lower() == 'q':
                     return None
                 
                 index = int(choice) - 1
-                if 0 <= index < min(10, len(products)):
-                    selected_product = products[index]
-                    # Get detailed information
-                    detailed_product = api.get_data_product(selected_product.id)
+                if 0 <= index < n_visible:
+                    # Detailed information, prefetched above
+                    detailed_product = detail_futures[index].result()
                     return detailed_product
                 else:
                     print("Invalid selection. Please try again.")
@@ -203,28 +296,23 @@ def analyze_pii_content(product: DataProduct):
     print(f"\n=== PII Content Analysis ===")
     print(f"Analyzing data product: {product.name}")
     
-    all_columns = []
-    
-    # Collect all columns from all views
-    if product.views:
-        for view in product.views:
-            if view.columns:
-                all_columns.extend(view.columns)
+    # Stream every column from every view and materialized view into the
+    # classifier without materializing an intermediate list
+    all_columns = chain(
+        chain.from_iterable(view.columns for view in (product.views or []) if view.columns),
+        chain.from_iterable(mv.columns for mv in (product.materializedViews or []) if mv.columns)
+    )
     
-    if product.materializedViews:
-        for mv in product.materializedViews:
-            if hasattr(mv, 'columns') and mv.columns:
-                all_columns.extend(mv.columns)
+    # Classify columns by PII sensitivity
+    classified_columns = classify_pii_columns(all_columns)
     
-    print(f"Total columns to analyze: {len(all_columns)}")
+    total_columns = sum(len(cols) for cols in classified_columns.values())
+    print(f"Total columns to analyze: {total_columns}")
     
-    if not all_columns:
+    if not total_columns:
         print("No columns found for analysis.")
         return {}
     
-    # Classify columns by PII sensitivity
-    classified_columns = classify_pii_columns(all_columns)
-    
     # Display analysis results
     print(f"\nPII Classification Results:")
     for classification, columns in classified_columns.items():
@@ -241,20 +329,16 @@ def apply_pii_tags_to_product(api: Api, product: DataProduct, classified_columns
     print(f"\n=== Applying PII Tags to Data Product ===")
     
     try:
-        # Get current tags
-        current_tags = api.get_tags(product.id)
-        current_values = [tag.value for tag in current_tags]
+        # Fetch current tags in the background while the new tag set is
+        # computed locally
+        current_tags_future = _EXECUTOR.submit(api.get_tags, product.id)
         
         # Determine which PII tags to add based on column classification
-        pii_tags_to_add = set()
-        
-        for classification, columns in classified_columns.items():
-            if columns and classification != 'NON_PII':
-                config = PII_CLASSIFICATIONS[classification]
-                pii_tags_to_add.update(config['tags'])
+        hit_cls = {cls for cls in _ALL_PII_CLS if classified_columns.get(cls)}
+        pii_tags_to_add = set().union(*(_TAGS_BY_CLS[cls] for cls in hit_cls))
         
         # Add general PII and compliance tags
-        if any(classified_columns[cls] for cls in classified_columns if cls != 'NON_PII'):
+        if hit_cls:
             pii_tags_to_add.update([
                 'contains-pii',
                 'data-privacy',
@@ -263,17 +347,18 @@ def apply_pii_tags_to_product(api: Api, product: DataProduct, classified_columns
             ])
         
         # Combine existing tags with new PII tags
-        all_tags = list(set(current_values + list(pii_tags_to_add)))
+        current_tags = current_tags_future.result()
+        current_values = {tag.value for tag in current_tags}
+        # Set union, sorted for deterministic output and payloads
+        all_tags = sorted(current_values | pii_tags_to_add)
         
-        print(f"Current tags: {current_values}")
+        print(f"Current tags: {sorted(current_values)}")
         print(f"Adding PII tags: {list(pii_tags_to_add)}")
         print(f"Final tags: {all_tags}")
         
-        # Apply the updated tags
-        api.update_tags(product.id, all_tags)
-        
-        # Verify the update
-        updated_tags = api.get_tags(product.id)
+        # Apply the updated tags; the PUT response already carries the final
+        # tag list, so no verification GET is needed
+        updated_tags = api.update_tags(product.id, all_tags)
         updated_values = [tag.value for tag in updated_tags]
         print(f"✓ Successfully applied PII tags: {updated_values}")
         
@@ -284,25 +369,68 @@ def apply_pii_tags_to_product(api: Api, product: DataProduct, classified_columns
         return False
 
 
-def get_pii_category_tag(column: Column, classified_columns: Dict[str, List[Column]]) -> str:
-    """Get the appropriate PII category tag for a column."""
-    for classification, columns in classified_columns.items():
-        if column in columns:
-            if classification == 'HIGH_SENSITIVITY':
-                return '<pii_high>'
-            elif classification == 'MEDIUM_SENSITIVITY':
-                return '<pii_medium>'
-            elif classification == 'LOW_SENSITIVITY':
-                return '<pii_low>'
-            elif classification == 'FINANCIAL':
-                return '<pii_financial>'
-            else:  # NON_PII
-                return '<non_pii>'
-    return '<non_pii>'
-
-
-def update_column_descriptions_with_pii(api: Api, product: DataProduct, classified_columns: Dict[str, List[Column]]):
-    """Update column descriptions with PII classification tags."""
+# Product tags per classification, flattened to frozensets once at import,
+# and the set of PII classification names
+_TAGS_BY_CLS = {cls: frozenset(cfg['tags']) for cls, cfg in PII_CLASSIFICATIONS.items()}
+_ALL_PII_CLS = frozenset(PII_CLASSIFICATIONS)
+
+# Description tag per classification, used when rewriting column descriptions
+_TAG_BY_CLS = {
+    'HIGH_SENSITIVITY': '<pii_high>',
+    'MEDIUM_SENSITIVITY': '<pii_medium>',
+    'LOW_SENSITIVITY': '<pii_low>',
+    'FINANCIAL': '<pii_financial>',
+    'NON_PII': '<non_pii>'
+}
+
+# Matches any existing PII tag in a description; derived from _TAG_BY_CLS so
+# the marker set has a single source of truth
+_PII_TAG_RE = re.compile('|'.join(map(re.escape, _TAG_BY_CLS.values())))
+
+
+@functools.lru_cache(maxsize=2048)
+def _tag_description(original_description: str, pii_tag: str) -> str:
+    """Replace an existing PII tag in a description, or append one.
+
+    Identical (description, tag) pairs recur across views sharing column
+    definitions, so the rewritten text is memoized.
+    """
+    updated_description, replaced = _PII_TAG_RE.subn(pii_tag, original_description)
+    if replaced == 0:
+        updated_description = f"{original_description} {pii_tag}"
+    return updated_description
+
+
+def _rewrite_columns(columns: List[Column], col_to_cls: Dict[int, str]) -> List[dict]:
+    """Build column dicts whose descriptions carry their PII tag."""
+    return [
+        {
+            'name': column.name,
+            'type': column.type,
+            'description': _tag_description(column.description or "No description",
+                                            _TAG_BY_CLS[col_to_cls.get(id(column), 'NON_PII')])
+        }
+        for column in columns
+    ]
+
+
+def _rewrite_view(view, col_to_cls: Dict[int, str]) -> dict:
+    """Build a view dict with PII-tagged column descriptions."""
+    return {
+        'name': view.name,
+        'description': view.description,
+        'definitionQuery': view.definitionQuery,
+        'columns': _rewrite_columns(view.columns or [], col_to_cls),
+        'markedForDeletion': False
+    }
+
+
+def update_column_descriptions_with_pii(api: Api, product: DataProduct, classified_columns: Dict[str, List[Column]]) -> Optional[DataProduct]:
+    """Update column descriptions with PII classification tags.
+
+    Returns the refreshed data product from the update response, or None
+    if the update was skipped or failed.
+    """
     print(f"\n=== Updating Column Descriptions with PII Classifications ===")
     
     try:
@@ -310,98 +438,27 @@ def update_column_descriptions_with_pii(api: Api, product: DataProduct, classifi
         response = input("Do you want to add PII classification tags to column descriptions? (y/N): ")
         if response.lower() not in ['y', 'yes']:
             print("Skipping column description updates.")
-            return False
+            return None
         
         print(f"Updating column descriptions with PII classification tags...")
         
-        # Create updated views with PII-tagged column descriptions
-        updated_views = []
+        # Invert the classification buckets once so the per-column lookup is
+        # O(1) by object identity instead of an ==-scan across every bucket
+        col_to_cls = {id(c): cls for cls, cols in classified_columns.items() for c in cols}
         
+        # Create updated views with PII-tagged column descriptions; the same
+        # helper serves views and materialized views
+        updated_views = []
         for view in product.views:
-            updated_columns = []
-            
-            for column in view.columns:
-                # Get the PII category tag for this column
-                pii_tag = get_pii_category_tag(column, classified_columns)
-                
-                # Update the column description with PII tag
-                original_description = column.description or "No description"
-                
-                # Check if PII tag already exists in description
-                if not any(tag in original_description for tag in ['<pii_high>', '<pii_medium>', '<pii_low>', '<pii_financial>', '<non_pii>']):
-                    updated_description = f"{original_description} {pii_tag}"
-                else:
-                    # Replace existing PII tag
-                    for existing_tag in ['<pii_high>', '<pii_medium>', '<pii_low>', '<pii_financial>', '<non_pii>']:
-                        if existing_tag in original_description:
-                            updated_description = original_description.replace(existing_tag, pii_tag)
-                            break
-                    else:
-                        updated_description = f"{original_description} {pii_tag}"
-                
-                # Create updated column dictionary
-                updated_column = {
-                    'name': column.name,
-                    'type': column.type,
-                    'description': updated_description
-                }
-                updated_columns.append(updated_column)
-                
-                print(f"  Updated {column.name}: {updated_description}")
-            
-            # Create updated view dictionary
-            updated_view = {
-                'name': view.name,
-                'description': view.description,
-                'definitionQuery': view.definitionQuery,
-                'columns': updated_columns,
-                'markedForDeletion': False
-            }
+            updated_view = _rewrite_view(view, col_to_cls)
+            for updated_column in updated_view['columns']:
+                print(f"  Updated {updated_column['name']}: {updated_column['description']}")
             updated_views.append(updated_view)
         
         # Create updated materialized views (if any)
-        updated_materialized_views = []
-        if product.materializedViews:
-            for mv in product.materializedViews:
-                updated_columns = []
-                
-                if hasattr(mv, 'columns') and mv.columns:
-                    for column in mv.columns:
-                        # Get the PII category tag for this column
-                        pii_tag = get_pii_category_tag(column, classified_columns)
-                        
-                        # Update the column description with PII tag
-                        original_description = column.description or "No description"
-                        
-                        # Check if PII tag already exists in description
-                        if not any(tag in original_description for tag in ['<pii_high>', '<pii_medium>', '<pii_low>', '<pii_financial>', '<non_pii>']):
-                            updated_description = f"{original_description} {pii_tag}"
-                        else:
-                            # Replace existing PII tag
-                            for existing_tag in ['<pii_high>', '<pii_medium>', '<pii_low>', '<pii_financial>', '<non_pii>']:
-                                if existing_tag in original_description:
-                                    updated_description = original_description.replace(existing_tag, pii_tag)
-                                    break
-                            else:
-                                updated_description = f"{original_description} {pii_tag}"
-                        
-                        # Create updated column dictionary
-                        updated_column = {
-                            'name': column.name,
-                            'type': column.type,
-                            'description': updated_description
-                        }
-                        updated_columns.append(updated_column)
-                
-                # Create updated materialized view dictionary
-                updated_mv = {
-                    'name': mv.name,
-                    'description': mv.description,
-                    'definitionQuery': mv.definitionQuery,
-                    'columns': updated_columns,
-                    'markedForDeletion': False
-                }
-                updated_materialized_views.append(updated_mv)
+        updated_materialized_views = [
+            _rewrite_view(mv, col_to_cls) for mv in (product.materializedViews or [])
+        ]
         
         # Create updated data product parameters
         updated_params = DataProductParameters(
@@ -426,11 +483,11 @@ def update_column_descriptions_with_pii(api: Api, product: DataProduct, classifi
         if updated_materialized_views:
             print(f"  Updated {len(updated_materialized_views)} materialized view(s)")
         
-        return True
+        return updated_product
         
     except Exception as e:
         print(f"✗ Error updating column descriptions: {e}")
-        return False
+        return None
 
 
 def create_pii_aware_data_product_example(api: Api, config: dict):
@@ -456,8 +513,10 @@ def create_pii_aware_data_product_example(api: Api, config: dict):
         else:
             domain_id = domains[0].id
         
-        # Generate unique name with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # One timestamp for the whole creation keeps the name, audit fields
+        # and tags consistent and avoids repeated strftime calls
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         product_name = f"customer_data_pii_{timestamp}"
         
         # Define columns with PII classifications
@@ -533,8 +592,8 @@ def create_pii_aware_data_product_example(api: Api, config: dict):
             status="DRAFT",
             columns=pii_columns,
             markedForDeletion=False,
-            createdAt=datetime.now(),
-            updatedAt=datetime.now(),
+            createdAt=now,
+            updatedAt=now,
             updatedBy="system",
             publishedAt=None,
             publishedBy=None,
@@ -591,7 +650,7 @@ def create_pii_aware_data_product_example(api: Api, config: dict):
             'requires-governance',
             'compliance-required',
             'customer-data',
-            f'pii-classified-{datetime.now().strftime("%Y%m%d")}'
+            f'pii-classified-{now.strftime("%Y%m%d")}'
         ]
         
         print(f"Applying comprehensive PII tags...")
@@ -605,6 +664,25 @@ def create_pii_aware_data_product_example(api: Api, config: dict):
         return None
 
 
+def _rekey_classification(classified_columns: Dict[str, List[Column]], product: DataProduct) -> Dict[str, List[Column]]:
+    """Point the classification buckets at a refreshed product's columns.
+
+    Classification depends only on column names and keywords, so after a
+    description-only update the buckets stay valid; swapping in the
+    refreshed Column instances lets reports show the new descriptions
+    without another full analysis pass.
+    """
+    refreshed = {
+        column.name: column
+        for view in chain(product.views or [], product.materializedViews or [])
+        for column in (view.columns or [])
+    }
+    return {
+        cls: [refreshed.get(column.name, column) for column in columns]
+        for cls, columns in classified_columns.items()
+    }
+
+
 def generate_pii_governance_report(product: DataProduct, classified_columns: Dict[str, List[Column]]):
     """Generate a PII governance report for the data product."""
     print(f"\n=== PII Governance Report ===")
@@ -612,20 +690,21 @@ def generate_pii_governance_report(product: DataProduct, classified_columns: Dic
     print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 50)
     
-    total_pii_columns = sum(len(cols) for cls, cols in classified_columns.items() if cls != 'NON_PII')
-    total_columns = sum(len(cols) for cols in classified_columns.values())
+    # One pass over the buckets covers every aggregate below
+    counts = {cls: len(cols) for cls, cols in classified_columns.items()}
+    total_columns = sum(counts.values())
+    total_pii_columns = total_columns - counts.get('NON_PII', 0)
     
     print(f"Summary:")
     print(f"  Total Columns: {total_columns}")
     print(f"  PII Columns: {total_pii_columns}")
-    print(f"  Non-PII Columns: {len(classified_columns.get('NON_PII', []))}")
+    print(f"  Non-PII Columns: {counts.get('NON_PII', 0)}")
     print(f"  PII Percentage: {(total_pii_columns/total_columns*100):.1f}%" if total_columns > 0 else "  PII Percentage: N/A")
     
     print(f"\nDetailed Classification:")
     for classification, columns in classified_columns.items():
         if columns:
-            config = PII_CLASSIFICATIONS.get(classification, {})
-            tags = config.get('tags', [])
+            tags = sorted(_TAGS_BY_CLS.get(classification, ()))
             
             print(f"\n  {classification} ({len(columns)} columns):")
             print(f"    Recommended Tags: {tags}")
@@ -675,53 +754,58 @@ def main():
         print(f"❌ Failed to connect to SEP cluster: {e}")
         sys.exit(1)
     
-    try:
-        print("\nPII Tagging Operations Menu:")
-        print("1. Analyze existing data product for PII")
-        print("2. Create PII-aware data product example")
-        
-        choice = input("\nSelect operation (1-2): ")
-        
-        if choice == '1':
-            # Analyze existing data product
-            product = select_data_product(api)
-            if product:
-                classified_columns = analyze_pii_content(product)
+    # The client's pooled session (keep-alive, connection reuse) serves
+    # every call below and is closed when the block exits
+    with api:
+        try:
+            print("\nPII Tagging Operations Menu:")
+            print("1. Analyze existing data product for PII")
+            print("2. Create PII-aware data product example")
+        
+            choice = input("\nSelect operation (1-2): ")
+        
+            if choice == '1':
+                # Analyze existing data product
+                product = select_data_product(api)
+                if product:
+                    classified_columns = analyze_pii_content(product)
                 
-                if any(classified_columns[cls] for cls in classified_columns if cls != 'NON_PII'):
-                    success = apply_pii_tags_to_product(api, product, classified_columns)
-                    if success:
-                        # Ask user if they want to update column descriptions with PII tags
-                        column_update_success = update_column_descriptions_with_pii(api, product, classified_columns)
-                        if column_update_success:
-                            # Refresh the product data to show updated descriptions in the report
-                            updated_product = api.get_data_product(product.id)
-                            # Re-analyze to show updated column descriptions
-                            updated_classified_columns = analyze_pii_content(updated_product)
-                            generate_pii_governance_report(updated_product, updated_classified_columns)
-                        else:
-                            generate_pii_governance_report(product, classified_columns)
-                else:
-                    print("No PII content detected in this data product.")
-        
-        elif choice == '2':
-            # Create PII-aware example
-            created_product = create_pii_aware_data_product_example(api, config)
-            if created_product:
-                # Analyze the created product
-                classified_columns = analyze_pii_content(created_product)
-                generate_pii_governance_report(created_product, classified_columns)
-        
-        else:
-            print("Invalid selection.")
+                    if any(classified_columns[cls] for cls in classified_columns if cls != 'NON_PII'):
+                        success = apply_pii_tags_to_product(api, product, classified_columns)
+                        if success:
+                            # Ask user if they want to update column descriptions with PII tags;
+                            # the update response already carries the refreshed product
+                            updated_product = update_column_descriptions_with_pii(api, product, classified_columns)
+                            if updated_product:
+                                # Only descriptions changed, so the earlier
+                                # classification still holds; re-key it to the
+                                # refreshed columns instead of re-analyzing
+                                updated_classified_columns = _rekey_classification(classified_columns, updated_product)
+                                generate_pii_governance_report(updated_product, updated_classified_columns)
+                            else:
+                                generate_pii_governance_report(product, classified_columns)
+                    else:
+                        print("No PII content detected in this data product.")
+        
+            elif choice == '2':
+                # Create PII-aware example
+                config = load_configuration()
+                created_product = create_pii_aware_data_product_example(api, config)
+                if created_product:
+                    # Analyze the created product
+                    classified_columns = analyze_pii_content(created_product)
+                    generate_pii_governance_report(created_product, classified_columns)
+        
+            else:
+                print("Invalid selection.")
+                sys.exit(1)
+        
+            print("\n" + "=" * 50)
+            print("PII tagging operations completed!")
+        
+        except Exception as e:
+            print(f"\n✗ Script failed: {e}")
             sys.exit(1)
-        
-        print("\n" + "=" * 50)
-        print("PII tagging operations completed!")
-        
-    except Exception as e:
-        print(f"\n✗ Script failed: {e}")
-        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -17,28 +17,29 @@ Make sure you have the necessary permissions and are connected to the
 correct environment.
 """
 
+import asyncio
 import os
+import shelve
 import sys
 import time
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 # Add the parent directory to sys.path to import the client
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from starburst_data_products_client.sep.api import Api
 from starburst_data_products_client.shared.auth_config import create_api_client_with_messages, get_auth_info, AuthenticationError
-from starburst_data_products_client.sep.data import (
-    DataProduct, 
-    DataProductSearchResult,
-    DataProductWorkflowStatus
-)
+from starburst_data_products_client.sep.data import DataProduct
+
+# Computed once; every configuration reader below shares it
+ENV_FILE = os.path.join(os.path.dirname(__file__), '.env')
 
 
 def display_auth_config():
     """Display current authentication configuration."""
     try:
-        env_file = os.path.join(os.path.dirname(__file__), '.env')
-        auth_info = get_auth_info(env_file)
+        auth_info = get_auth_info(ENV_FILE)
         
         print("=== Authentication Configuration ===")
         print(f"Method: {auth_info['method']}")
@@ -66,37 +67,82 @@ def display_auth_config():
         sys.exit(1)
 
 
-def load_configuration():
-    """Load configuration from .env file."""
-    from dotenv import load_dotenv
-    load_dotenv(os.path.join(os.path.dirname(__file__), '.env'))
-    
-    # Helper function to parse SSL_VERIFY setting
-    def parse_ssl_verify(value):
-        if value is None:
-            return True  # Default to True for security
-        return value.lower() in ('true', '1', 'yes', 'on')
-    
-    config = {
-        'host': os.getenv('SEP_HOST'),
-        'username': os.getenv('SEP_USERNAME'),
-        'password': os.getenv('SEP_PASSWORD'),
-        'protocol': os.getenv('SEP_PROTOCOL', 'https'),
-        'ssl_verify': parse_ssl_verify(os.getenv('SSL_VERIFY')),
-        'catalog_name': os.getenv('DEFAULT_CATALOG_NAME', 'hive'),
-        'schema_name': os.getenv('DEFAULT_SCHEMA_NAME', 'example'),
-        'domain_name': os.getenv('DEFAULT_DOMAIN_NAME', 'example_domain')
-    }
-    
-    # Validate required configuration
-    required_vars = ['host', 'username', 'password']
-    missing_vars = [key for key in required_vars if not config[key]]
-    if missing_vars:
-        print(f"Error: Missing required environment variables: {', '.join(missing_vars)}")
-        print("Please copy .env.example to .env and update with your values.")
-        sys.exit(1)
-    
-    return config
+# Terminal workflow states, built once for O(1) membership in the poll loop
+_TERMINAL_SUCCESS = frozenset({"COMPLETED", "PUBLISHED", "SUCCESS"})
+_TERMINAL_FAILURE = frozenset({"FAILED", "ERROR"})
+
+# Best-effort persistent record of workflows already observed in a terminal
+# state, so re-running the script doesn't re-poll outcomes it has seen.
+# Entries are dropped whenever this script initiates a new publish
+_STATUS_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'starburst_dp')
+_STATUS_CACHE_PATH = os.path.join(_STATUS_CACHE_DIR, 'workflow_status')
+_STATUS_CACHE_VERSION = 1
+
+
+def _load_terminal_status(product_id: str) -> Optional[dict]:
+    """Return the recorded terminal workflow status for a product, if any."""
+    try:
+        with shelve.open(_STATUS_CACHE_PATH, flag='r') as db:
+            entry = db.get(product_id)
+    except Exception:
+        return None
+    if entry and entry.get('version') == _STATUS_CACHE_VERSION:
+        return entry
+    return None
+
+
+def _store_terminal_status(product_id: str, workflow_type: Optional[str], status: str):
+    """Record a terminal workflow status; failures are ignored."""
+    try:
+        os.makedirs(_STATUS_CACHE_DIR, exist_ok=True)
+        with shelve.open(_STATUS_CACHE_PATH) as db:
+            db[product_id] = {
+                'version': _STATUS_CACHE_VERSION,
+                'workflowType': workflow_type,
+                'status': status,
+                'ts': time.time()
+            }
+    except Exception:
+        pass
+
+
+def _drop_terminal_status(product_id: str):
+    """Forget a recorded terminal status, e.g. before a new publish."""
+    try:
+        with shelve.open(_STATUS_CACHE_PATH) as db:
+            if product_id in db:
+                del db[product_id]
+    except Exception:
+        pass
+
+
+# Shared pool for prefetching product detail while the user reads the menu
+_EXECUTOR = ThreadPoolExecutor(max_workers=10)
+
+# Full search result for the interactive menu, cached briefly so re-entering
+# the menu within the TTL costs no round-trip; pages are sliced client-side
+# because the SearchOptions schema has no offset field, and product detail
+# is already TTL-cached inside the Api client
+_PAGE_SIZE = 10
+_SEARCH_CACHE_TTL_SECONDS = 30.0
+_search_cache = {}
+
+
+def _cached_search(api: Api):
+    """Return the (possibly cached) full search result for the menu."""
+    entry = _search_cache.get('all')
+    if entry is not None and time.monotonic() - entry[0] < _SEARCH_CACHE_TTL_SECONDS:
+        return entry[1]
+    products = api.search_data_products()
+    _search_cache['all'] = (time.monotonic(), products)
+    return products
+
+
+def _invalidate_caches(api: Api, dp_id: str):
+    """Drop cached state for a product whose server-side status changed."""
+    _search_cache.clear()
+    api.invalidate_product_cache(dp_id)
+    _drop_terminal_status(dp_id)
 
 
 def select_data_product(api: Api) -> Optional[DataProduct]:
@@ -104,39 +150,53 @@ def select_data_product(api: Api) -> Optional[DataProduct]:
     print("=== Select Data Product to Publish ===")
     
     try:
-        # Search for data products
-        products = api.search_data_products()
-        if not products:
+        # One search fetches everything; the menu pages through it locally
+        all_products = _cached_search(api)
+        if not all_products:
             print("No data products found.")
             return None
+        offset = 0
+        products = all_products[:_PAGE_SIZE]
         
-        print("\nAvailable data products:")
-        for i, product in enumerate(products[:10]):  # Show first 10
-            print(f"  {i+1}. {product.name} (ID: {product.id})")
-        
-        if len(products) > 10:
-            print(f"  ... and {len(products) - 10} more")
-        
-        # Get user selection
         while True:
-            try:
-                choice = input(f"\nSelect a data product (1-{min(10, len(products))}) or 'q' to quit: ")
-                if choice.lower() == 'q':
-                    return None
-                
-                index = int(choice) - 1
-                if 0 <= index < min(10, len(products)):
-                    selected_product = products[index]
-                    # Get detailed information
-                    detailed_product = api.get_data_product(selected_product.id)
-                    print(f"\nSelected: {detailed_product.name}")
-                    print(f"Status: {detailed_product.status}")
-                    print(f"Description: {detailed_product.description or 'No description'}")
-                    return detailed_product
-                else:
-                    print("Invalid selection. Please try again.")
-            except ValueError:
-                print("Please enter a valid number.")
+            print("\nAvailable data products:")
+            for i, product in enumerate(products, 1):
+                print(f"  {i}. {product.name} (ID: {product.id})")
+            
+            # Prefetch detail for the visible items concurrently while the
+            # user is choosing; the results land in the client's TTL cache,
+            # so the follow-up get_data_product on selection is a cache hit
+            detail_futures = [_EXECUTOR.submit(api.get_data_product, p.id) for p in products]
+            
+            # Get user selection
+            redraw = False
+            while not redraw:
+                try:
+                    choice = input(f"\nSelect a data product (1-{len(products)}), 'm' for more, or 'q' to quit: ")
+                    if choice.lower() == 'q':
+                        return None
+                    
+                    if choice.lower() == 'm':
+                        if offset + _PAGE_SIZE >= len(all_products):
+                            print("No more data products.")
+                            continue
+                        offset += _PAGE_SIZE
+                        products = all_products[offset:offset + _PAGE_SIZE]
+                        redraw = True
+                        continue
+                    
+                    index = int(choice) - 1
+                    if 0 <= index < len(products):
+                        # Detailed information, prefetched above
+                        detailed_product = detail_futures[index].result()
+                        print(f"\nSelected: {detailed_product.name}")
+                        print(f"Status: {detailed_product.status}")
+                        print(f"Description: {detailed_product.description or 'No description'}")
+                        return detailed_product
+                    else:
+                        print("Invalid selection. Please try again.")
+                except ValueError:
+                    print("Please enter a valid number.")
                 
     except Exception as e:
         print(f"Error selecting data product: {e}")
@@ -148,6 +208,13 @@ def publish_data_product(api: Api, product: DataProduct, force: bool = False):
     print(f"\n=== Publishing Data Product ===")
     
     try:
+        # A product already in the terminal PUBLISHED state needs no
+        # publish request at all unless a force republish was asked for
+        if not force and product.status == "PUBLISHED":
+            print(f"⚠ Data product '{product.name}' is already published; nothing to do")
+            print("  Use force republish to recreate its datasets")
+            return
+        
         action = "Force republishing" if force else "Publishing"
         print(f"{action} data product: {product.name}")
         print(f"Product ID: {product.id}")
@@ -157,63 +224,89 @@ def publish_data_product(api: Api, product: DataProduct, force: bool = False):
         api.publish_data_product(product.id, force=force)
         print("✓ Publish workflow initiated")
         
+        # The publish changes the product's status, so cached listings and
+        # detail must not be served stale
+        _invalidate_caches(api, product.id)
+        
         # Monitor publish status with better error handling
-        monitor_publish_workflow(api, product.id, product.name)
+        asyncio.run(monitor_publish_workflow(api, product.id, product.name))
         
     except Exception as e:
         print(f"✗ Error publishing data product: {e}")
 
 
-def monitor_publish_workflow(api: Api, product_id: str, product_name: str, max_attempts: int = 30):
-    """Monitor the publish workflow status until completion."""
+async def monitor_publish_workflow(api: Api, product_id: str, product_name: str, max_seconds: float = 90):
+    """Monitor the publish workflow status until completion.
+
+    Polls with exponential backoff - 1s doubling up to a 30s cap, reset
+    whenever the reported status changes - until a terminal status is seen
+    or the max_seconds deadline passes. Long-running publishes cost far
+    fewer round-trips than fixed-interval polling would.
+
+    Polling is the only notification mechanism the SEP REST API offers:
+    there is no webhook registration, Server-Sent Events, or WebSocket
+    channel on the publish endpoints, so streaming status updates instead
+    of polling is not an option; the backoff above is the cheapest
+    substitute the server supports.
+    """
     print(f"\n=== Monitoring Publish Workflow ===")
     
-    attempt = 0
-    start_time = time.time()
+    start_time = time.monotonic()
+    deadline = start_time + max_seconds
+    delay = 1.0
+    last_status = None
     
     try:
-        while attempt < max_attempts:
+        while time.monotonic() < deadline:
             try:
-                status = api.get_publish_data_product_status(product_id)
-                elapsed_time = time.time() - start_time
+                status = await asyncio.to_thread(api.get_publish_data_product_status, product_id)
+                elapsed_time = time.monotonic() - start_time
                 
                 print(f"  [{int(elapsed_time):03d}s] Status: {status.status}")
                 
                 # Handle successful completion
-                if status.status in ["COMPLETED", "PUBLISHED", "SUCCESS"]:
+                if status.status in _TERMINAL_SUCCESS:
                     print(f"✓ Data product '{product_name}' published successfully!")
                     print(f"  Total time: {int(elapsed_time)} seconds")
-                    if hasattr(status, 'isFinalStatus') and status.isFinalStatus:
+                    if status.isFinalStatus:
                         print("  Final status reached")
+                        _store_terminal_status(product_id, status.workflowType, status.status)
                     return True
                 
                 # Handle failure states
-                elif status.status in ["FAILED", "ERROR"]:
+                elif status.status in _TERMINAL_FAILURE:
                     print(f"✗ Publishing failed for '{product_name}'")
-                    if hasattr(status, 'errors') and status.errors:
+                    if status.errors:
                         print("  Errors:")
                         for error in status.errors:
                             print(f"    - {error.entityType} '{error.entityName}': {error.message}")
+                    if status.isFinalStatus:
+                        _store_terminal_status(product_id, status.workflowType, status.status)
                     return False
                 
                 # Handle in-progress states
                 else:
-                    progress_msg = f"  Publishing in progress... (attempt {attempt + 1}/{max_attempts})"
-                    if hasattr(status, 'workflowType'):
+                    progress_msg = f"  Publishing in progress... (next check in {delay:.0f}s)"
+                    if status.workflowType:
                         progress_msg += f" | Type: {status.workflowType}"
                     print(progress_msg)
                     
-                    time.sleep(3)  # Wait 3 seconds between checks
-                    attempt += 1
+                    # A state transition means the workflow is moving, so
+                    # poll eagerly again; otherwise keep backing off
+                    if status.status != last_status:
+                        delay = 1.0
+                        last_status = status.status
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 30)
                     
             except Exception as status_error:
                 print(f"  Error checking status: {status_error}")
-                # If we can't check status, wait a bit and try again
-                time.sleep(5)
-                attempt += 1
+                # If we can't check status, back off and try again
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30)
         
         # Timeout handling
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.monotonic() - start_time
         print(f"⚠ Publishing status monitoring timed out after {int(elapsed_time)} seconds")
         print(f"  The publish workflow may still be in progress")
         print(f"  Check the SEP UI or run this script again to verify status")
@@ -225,6 +318,41 @@ def monitor_publish_workflow(api: Api, product_id: str, product_name: str, max_a
         return None
 
 
+async def _queue_and_monitor(api: Api):
+    """Queue workflows to monitor while earlier ones are already polling.
+
+    Monitoring starts the moment a product is chosen, and the selection
+    and confirmation prompts run on a worker thread via asyncio.to_thread,
+    so background polls keep flowing while the user is thinking. Total
+    wait is the slowest workflow rather than the sum."""
+    tasks = []
+    try:
+        while True:
+            product = await asyncio.to_thread(select_data_product, api)
+            if not product:
+                break
+            tasks.append(asyncio.create_task(
+                monitor_publish_workflow(api, product.id, product.name, max_seconds=60)
+            ))
+            more = await asyncio.to_thread(input, "Queue another product to monitor as well? (y/N): ")
+            if more.lower() not in ['y', 'yes']:
+                break
+    finally:
+        if tasks:
+            await asyncio.gather(*tasks)
+
+
+def _is_not_found(exc: Exception, marker: str) -> bool:
+    """Recognize a missing-workflow error from the Api.
+
+    The Api raises plain Exception carrying the response text, so the only
+    signal is the body itself; stringify the exception once and check both
+    the HTTP code and the SEP error-code marker.
+    """
+    text = str(exc)
+    return "404" in text or marker in text
+
+
 def check_workflow_status(api: Api, product: DataProduct):
     """Check the current workflow status without initiating a new publish."""
     print(f"\n=== Current Workflow Status ===")
@@ -232,36 +360,52 @@ def check_workflow_status(api: Api, product: DataProduct):
     try:
         print(f"Checking workflow status for: {product.name}")
         
-        # Check publish status
-        try:
-            status = api.get_publish_data_product_status(product.id)
-            print(f"  Publish Status: {status.status}")
-            if hasattr(status, 'workflowType'):
+        # A workflow this client already saw finish needs no fresh status
+        # round-trip; the record is dropped when a new publish starts
+        cached = _load_terminal_status(product.id)
+        
+        # The remaining lookups are independent, so issue them concurrently
+        # and report in deterministic order below
+        publish_future = None if cached else _EXECUTOR.submit(api.get_publish_data_product_status, product.id)
+        delete_future = _EXECUTOR.submit(api.get_delete_data_product_status, product.id)
+        product_future = _EXECUTOR.submit(api.get_data_product, product.id)
+        
+        if cached:
+            print(f"  Publish Status: {cached['status']} (cached terminal state)")
+            if cached.get('workflowType'):
+                print(f"  Workflow Type: {cached['workflowType']}")
+            print("  Is Final Status: True")
+        else:
+            # Check publish status
+            try:
+                status = publish_future.result()
+                print(f"  Publish Status: {status.status}")
                 print(f"  Workflow Type: {status.workflowType}")
-            if hasattr(status, 'isFinalStatus'):
                 print(f"  Is Final Status: {status.isFinalStatus}")
-            if hasattr(status, 'errors') and status.errors:
-                print("  Errors:")
-                for error in status.errors:
-                    print(f"    - {error.entityType} '{error.entityName}': {error.message}")
-        except Exception as e:
-            if "404" in str(e) or "PUBLISH_OPERATION_NOT_FOUND" in str(e):
-                print("  No active publish workflow found")
-            else:
-                print(f"  Error checking publish status: {e}")
+                if status.errors:
+                    print("  Errors:")
+                    for error in status.errors:
+                        print(f"    - {error.entityType} '{error.entityName}': {error.message}")
+                if status.isFinalStatus:
+                    _store_terminal_status(product.id, status.workflowType, status.status)
+            except Exception as e:
+                if _is_not_found(e, "PUBLISH_OPERATION_NOT_FOUND"):
+                    print("  No active publish workflow found")
+                else:
+                    print(f"  Error checking publish status: {e}")
         
         # Check delete status as well
         try:
-            delete_status = api.get_delete_data_product_status(product.id)
+            delete_status = delete_future.result()
             print(f"  Delete Status: {delete_status.status}")
         except Exception as e:
-            if "404" in str(e) or "DELETE_OPERATION_NOT_FOUND" in str(e):
+            if _is_not_found(e, "DELETE_OPERATION_NOT_FOUND"):
                 print("  No active delete workflow found")
             else:
                 print(f"  Error checking delete status: {e}")
         
         # Show current product status
-        current_product = api.get_data_product(product.id)
+        current_product = product_future.result()
         print(f"  Product Status: {current_product.status}")
         
     except Exception as e:
@@ -311,15 +455,13 @@ def demonstrate_publish_operations(api: Api):
                     check_workflow_status(api, product)
                     
             elif choice == '4':
-                # Monitor ongoing workflow
-                product = select_data_product(api)
-                if product:
-                    print("Monitoring workflow status (this will not initiate a new publish)...")
-                    try:
-                        # Just monitor without publishing
-                        monitor_publish_workflow(api, product.id, product.name, max_attempts=20)
-                    except Exception as e:
-                        print(f"Error monitoring workflow: {e}")
+                # Monitor ongoing workflows; monitoring starts as soon as a
+                # product is queued and keeps polling through the prompts
+                print("Monitoring workflow status (this will not initiate a new publish)...")
+                try:
+                    asyncio.run(_queue_and_monitor(api))
+                except Exception as e:
+                    print(f"Error monitoring workflow: {e}")
                         
             elif choice == '5':
                 print("Exiting publish workflow operations")
@@ -348,8 +490,7 @@ def main():
     
     # Initialize API client using centralized authentication
     try:
-        env_file = os.path.join(os.path.dirname(__file__), '.env')
-        api = create_api_client_with_messages(env_file)
+        api = create_api_client_with_messages(ENV_FILE)
         print(f"✅ Successfully connected to SEP cluster using {auth_info['method']} authentication")
     except AuthenticationError as e:
         print(f"❌ Authentication error: {e}")
@@ -364,8 +505,11 @@ def main():
         sys.exit(1)
     
     try:
-        # Demonstrate publish workflow operations
-        demonstrate_publish_operations(api)
+        # The client's pooled keep-alive session serves every call in the
+        # menu loop - including the polling monitor - over one warm
+        # connection, and is closed when the block exits
+        with api:
+            demonstrate_publish_operations(api)
         
         print("\n" + "=" * 55)
         print("Publish workflow operations completed!")
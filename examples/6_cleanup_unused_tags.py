@@ -25,9 +25,11 @@ Safety Features:
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from datetime import datetime
 from typing import List, Dict, Set, Tuple
-from collections import Counter
+from collections import Counter, defaultdict
 
 # Add the parent directory to sys.path to import the client
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -102,8 +104,13 @@ def load_configuration():
     return config
 
 
-def scan_data_product_tags(api: Api) -> Tuple[Dict[str, Set[str]], Dict[str, int]]:
-    """Scan all data products and collect tag usage information."""
+def scan_data_product_tags(api: Api) -> Tuple[Dict[str, Set[str]], Dict[str, int], List[str]]:
+    """Scan all data products and collect tag usage information.
+
+    The full tag inventory comes from the list_tags collection endpoint in
+    one round trip, so unused tags are actually visible; per-product usage
+    is aggregated client-side since the API offers no usage counts.
+    """
     print("=== Scanning Data Products for Tag Usage ===")
     
     try:
@@ -113,75 +120,47 @@ def scan_data_product_tags(api: Api) -> Tuple[Dict[str, Set[str]], Dict[str, int
         
         if not products:
             print("No data products found.")
-            return {}, {}
+            return {}, {}, []
         
         print(f"Found {len(products)} data product(s)")
         
-        tag_to_products = {}  # tag_value -> set of product names that use it
-        tag_usage_count = {}  # tag_value -> count of products using it
-        
-        # Scan each data product for tags
-        for i, product in enumerate(products, 1):
-            print(f"  Scanning {i}/{len(products)}: {product.name}")
-            
-            try:
-                # Get detailed product information including tags
-                detailed_product = api.get_data_product(product.id)
-                product_tags = api.get_tags(product.id)
-                
-                for tag in product_tags:
-                    tag_value = tag.value
-                    
-                    # Initialize tracking for this tag if not seen before
-                    if tag_value not in tag_to_products:
-                        tag_to_products[tag_value] = set()
-                        tag_usage_count[tag_value] = 0
-                    
-                    # Record which product uses this tag
-                    tag_to_products[tag_value].add(product.name)
-                    tag_usage_count[tag_value] += 1
-                    
-            except Exception as e:
-                print(f"    ⚠️ Error scanning {product.name}: {e}")
-                continue
-        
-        return tag_to_products, tag_usage_count
+        tag_to_products = defaultdict(set)  # tag_value -> product names using it
+        tag_usage_count = Counter()  # tag_value -> count of products using it
         
-    except Exception as e:
-        print(f"✗ Error scanning data products: {e}")
-        return {}, {}
-
-
-def get_all_available_tags(api: Api) -> List[str]:
-    """Get all available tags in the system."""
-    print("\n=== Getting All Available Tags ===")
-    
-    try:
-        # Note: This assumes there's a method to get all tags in the system
-        # If this method doesn't exist, we'll need to collect tags differently
-        
-        # Alternative approach: collect unique tags from all data products
-        print("Collecting all unique tags from data products...")
-        products = api.search_data_products()
-        all_tags = set()
+        # The scan is pure I/O wait, so fan the get_tags calls out over a
+        # thread pool; results are collected first and merged only in this
+        # thread, so the accumulators need no locking
+        scanned = []
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            # The full tag inventory comes from the collection endpoint in a
+            # single round trip; only per-product usage needs the fan-out
+            all_tags_future = executor.submit(api.list_tags)
+            futures = {executor.submit(api.get_tags, product.id): product for product in products}
+            # A progress line per product is one syscall each and drowns the
+            # output on big catalogs; report every 50 completions instead
+            total = len(products)
+            for i, future in enumerate(as_completed(futures), 1):
+                product = futures[future]
+                if i % 50 == 0 or i == total:
+                    print(f"  Scanned {i}/{total} products")
+                try:
+                    scanned.append((product.name, future.result()))
+                except Exception as e:
+                    print(f"    ⚠️ Error scanning {product.name}: {e}")
         
-        for product in products:
-            try:
-                product_tags = api.get_tags(product.id)
-                for tag in product_tags:
-                    all_tags.add(tag.value)
-            except Exception as e:
-                print(f"    ⚠️ Error getting tags for {product.name}: {e}")
-                continue
+        for product_name, product_tags in scanned:
+            for tag in product_tags:
+                tag_to_products[tag.value].add(product_name)
+                tag_usage_count[tag.value] += 1
         
-        all_tags_list = sorted(list(all_tags))
-        print(f"Found {len(all_tags_list)} unique tags in the system")
+        all_tags = sorted(tag.value for tag in all_tags_future.result())
+        print(f"Found {len(all_tags)} unique tags in the system")
         
-        return all_tags_list
+        return tag_to_products, tag_usage_count, all_tags
         
     except Exception as e:
-        print(f"✗ Error getting all tags: {e}")
-        return []
+        print(f"✗ Error scanning data products: {e}")
+        return {}, {}, []
 
 
 def analyze_tag_usage(tag_to_products: Dict[str, Set[str]], tag_usage_count: Dict[str, int], all_tags: List[str]) -> Dict[str, List[str]]:
@@ -189,32 +168,27 @@ def analyze_tag_usage(tag_to_products: Dict[str, Set[str]], tag_usage_count: Dic
     print(f"\n=== Tag Usage Analysis ===")
     
     # Categorize tags
-    used_tags = set(tag_usage_count.keys())
-    all_tags_set = set(all_tags)
-    unused_tags = all_tags_set - used_tags
+    # dict.keys() is already a set-like view, so no copy is needed for the
+    # difference
+    unused_tags = set(all_tags) - tag_usage_count.keys()
     
-    # Sort tags by usage frequency
+    # Bucket tags by usage frequency in one pass, sorting each bucket once
     frequently_used = []
     occasionally_used = []
     rarely_used = []
     
     for tag, count in tag_usage_count.items():
-        if count >= 5:
-            frequently_used.append(tag)
-        elif count >= 2:
-            occasionally_used.append(tag)
-        else:
-            rarely_used.append(tag)
+        bucket = frequently_used if count >= 5 else occasionally_used if count >= 2 else rarely_used
+        bucket.append(tag)
     
-    # Sort each category
     frequently_used.sort()
     occasionally_used.sort()
     rarely_used.sort()
-    unused_tags_list = sorted(list(unused_tags))
+    unused_tags_list = sorted(unused_tags)
     
     print(f"Tag Usage Summary:")
     print(f"  Total unique tags in system: {len(all_tags)}")
-    print(f"  Tags in use: {len(used_tags)}")
+    print(f"  Tags in use: {len(tag_usage_count)}")
     print(f"  Unused tags: {len(unused_tags)}")
     print(f"  Frequently used (5+ products): {len(frequently_used)}")
     print(f"  Occasionally used (2-4 products): {len(occasionally_used)}")
@@ -246,18 +220,18 @@ def display_detailed_tag_report(tag_to_products: Dict[str, Set[str]], tag_usage_
         print(f"\n🟡 OCCASIONALLY USED TAGS ({len(categorized_tags['occasionally_used'])} tags):")
         for tag in categorized_tags['occasionally_used']:
             count = tag_usage_count[tag]
-            products = list(tag_to_products[tag])[:3]  # Show first 3 products
-            products_str = ", ".join(products)
-            if len(tag_to_products[tag]) > 3:
-                products_str += f", +{len(tag_to_products[tag]) - 3} more"
+            products_set = tag_to_products[tag]
+            n = len(products_set)
+            products_str = ", ".join(islice(products_set, 3))  # Show first 3 products
+            if n > 3:
+                products_str += f", +{n - 3} more"
             print(f"  • {tag} (used by {count} products: {products_str})")
     
     # Show rarely used tags
     if categorized_tags['rarely_used']:
         print(f"\n🟠 RARELY USED TAGS ({len(categorized_tags['rarely_used'])} tags):")
         for tag in categorized_tags['rarely_used']:
-            products = list(tag_to_products[tag])
-            products_str = ", ".join(products)
+            products_str = ", ".join(tag_to_products[tag])
             print(f"  • {tag} (used by: {products_str})")
     
     # Show unused tags
@@ -392,29 +366,36 @@ def demonstrate_tag_cleanup_operations(api: Api):
     print("2. Generate detailed tag usage report")
     print("3. Clean up unused tags")
     print("4. Full cleanup workflow (recommended)")
-    print("5. Exit")
+    print("5. Refresh cached scan data")
+    print("6. Exit")
     
+    # Tag usage changes on a human timescale, so one scan serves the whole
+    # session; each menu option reuses it instead of re-walking every product
+    cache = {}
+
+    def scan():
+        if 'scan' not in cache:
+            cache['scan'] = scan_data_product_tags(api)
+        return cache['scan']
+
     while True:
         try:
-            choice = input(f"\nSelect an option (1-5): ").strip()
+            choice = input(f"\nSelect an option (1-6): ").strip()
             
             if choice == '1':
                 # Scan and analyze tags
-                tag_to_products, tag_usage_count = scan_data_product_tags(api)
-                all_tags = get_all_available_tags(api)
+                tag_to_products, tag_usage_count, all_tags = scan()
                 categorized_tags = analyze_tag_usage(tag_to_products, tag_usage_count, all_tags)
                 
             elif choice == '2':
                 # Generate detailed report
-                tag_to_products, tag_usage_count = scan_data_product_tags(api)
-                all_tags = get_all_available_tags(api)
+                tag_to_products, tag_usage_count, all_tags = scan()
                 categorized_tags = analyze_tag_usage(tag_to_products, tag_usage_count, all_tags)
                 display_detailed_tag_report(tag_to_products, tag_usage_count, categorized_tags)
                 
             elif choice == '3':
                 # Clean up unused tags
-                tag_to_products, tag_usage_count = scan_data_product_tags(api)
-                all_tags = get_all_available_tags(api)
+                tag_to_products, tag_usage_count, all_tags = scan()
                 categorized_tags = analyze_tag_usage(tag_to_products, tag_usage_count, all_tags)
                 
                 tags_to_delete = select_tags_for_deletion(categorized_tags)
@@ -426,8 +407,7 @@ def demonstrate_tag_cleanup_operations(api: Api):
                 print("\n=== Full Tag Cleanup Workflow ===")
                 
                 # Step 1: Scan and analyze
-                tag_to_products, tag_usage_count = scan_data_product_tags(api)
-                all_tags = get_all_available_tags(api)
+                tag_to_products, tag_usage_count, all_tags = scan()
                 categorized_tags = analyze_tag_usage(tag_to_products, tag_usage_count, all_tags)
                 
                 # Step 2: Show detailed report
@@ -445,11 +425,16 @@ def demonstrate_tag_cleanup_operations(api: Api):
                     print("\n✓ No tags selected for deletion. Cleanup completed.")
                 
             elif choice == '5':
+                # Drop the cached scan so the next option re-reads the cluster
+                cache.clear()
+                print("Cached scan data cleared; the next operation will rescan")
+                
+            elif choice == '6':
                 print("Exiting tag cleanup operations")
                 break
                 
             else:
-                print("Invalid option. Please select 1-5.")
+                print("Invalid option. Please select 1-6.")
                 
         except KeyboardInterrupt:
             print(f"\nOperation interrupted")
@@ -8,7 +8,10 @@ from starburst_data_products_client.sep.data import SampleQuery
 from starburst_data_products_client.sep.data import Tag
 
 import requests
+import time
 import warnings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Optional, Union, Any, Dict
 from json import dumps
 
@@ -75,6 +78,8 @@ class Api:
     DOMAIN_PATH = 'api/v1/dataProduct/domains'
     DATA_PRODUCT_PATH = 'api/v1/dataProduct/products'
     DATA_PRODUCT_TAGS_PATH = 'api/v1/dataProduct/tags'
+    # How long a fetched data product may be served from the in-process cache
+    PRODUCT_CACHE_TTL_SECONDS = 60.0
 
     def __init__(self, host: str, username: str = None, password: str = None, 
                  auth: 'Authentication' = None, protocol: str = 'https', verify_ssl: bool = True):
@@ -121,6 +126,32 @@ class Api:
             from urllib3.exceptions import InsecureRequestWarning
             warnings.filterwarnings('ignore', category=InsecureRequestWarning)
 
+        # Use one pooled session with keep-alive so sequential API calls
+        # reuse the same TCP/TLS connection instead of handshaking per call
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self._session.headers['Connection'] = 'keep-alive'
+
+        # Short-lived cache of fetched data products, keyed by id, so callers
+        # that pass the same product through several helpers do not refetch it
+        self._product_cache: Dict[str, Any] = {}
+
+    def close(self):
+        """Close the underlying pooled session and its connections."""
+        self._session.close()
+
+    def __enter__(self) -> 'Api':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def _get_auth_kwargs(self) -> Dict[str, Any]:
         """Get authentication parameters for requests.
         
@@ -136,14 +167,19 @@ class Api:
             return {'auth': (self.username, self.password)}
 
     # --- data product API methods ---
-    def search_data_products(self, search_string: str=None) -> List[DataProductSearchResult]:
+    def search_data_products(self, search_string: str=None, limit: int=None) -> List[DataProductSearchResult]:
         """Search for data products matching the given search string.
 
         The search is performed against all data product attributes and is case-insensitive.
         The search string is bookended by '%' for partial matching.
 
+        The SearchOptions schema has no offset field, so server-side
+        pagination is not available; callers that page through results
+        should slice a single full search client-side.
+
         Args:
             search_string (str, optional): The string to search for. Defaults to None.
+            limit (int, optional): Maximum number of results to return. Defaults to None (no limit).
 
         Returns:
             List[DataProductSearchResult]: List of matching data product search results
@@ -154,9 +190,14 @@ class Api:
         #REQUEST searchOptions.searchString is bookended by '%' and compared against all
         #dp attributes https://github.com/starburstdata/starburst-enterprise/blob/807dbbbfb48b7e5ea87777fc3aae8cd360dea1e8/core/starburst-server-main/src/main/java/com/starburstdata/presto/dataproduct/search/SearchSqlBuilder.java#L213
 
-        params = {'searchOptions': dumps({'searchString': search_string})} if search_string is not None else None
+        search_options = {}
+        if search_string is not None:
+            search_options['searchString'] = search_string
+        if limit is not None:
+            search_options['limit'] = limit
+        params = {'searchOptions': dumps(search_options)} if search_options else None
         auth_kwargs = self._get_auth_kwargs()
-        response = requests.get(
+        response = self._session.get(
             url=f'{self.protocol}://{self.host}/{self.DATA_PRODUCT_PATH}',
             params=params,
             verify=self.verify_ssl,
@@ -183,7 +224,7 @@ class Api:
             Exception: If the API request fails
         """
         auth_kwargs = self._get_auth_kwargs()
-        response = requests.post(
+        response = self._session.post(
             url=f'{self.protocol}://{self.host}/{self.DATA_PRODUCT_PATH}',
             json=data_product.asdict(),
             verify=self.verify_ssl,
@@ -225,7 +266,7 @@ class Api:
         if domain_id is not None:
             body['dataDomainId'] = domain_id
         auth_kwargs = self._get_auth_kwargs()
-        response = requests.post(
+        response = self._session.post(
             url=f'{self.protocol}://{self.host}/{self.DATA_PRODUCT_PATH}/{dp_id}/clone',
             json=body,
             verify=self.verify_ssl,
@@ -233,7 +274,9 @@ class Api:
         )
         if not response.ok:
             raise Exception(f'Request returned code {response.status_code}.\nResponse body: {response.text}')
-        return DataProduct.load(response.json())
+        product = DataProduct.load(response.json())
+        self._product_cache[product.id] = (time.monotonic(), product)
+        return product
     
 
     def get_data_product(self, dp_id: str) -> DataProduct:
@@ -248,17 +291,37 @@ class Api:
         Raises:
             Exception: If the API request fails
         """
+        cached = self._product_cache.get(dp_id)
+        if cached is not None and time.monotonic() - cached[0] < self.PRODUCT_CACHE_TTL_SECONDS:
+            return cached[1]
         auth_kwargs = self._get_auth_kwargs()
-        response = requests.get(
+        response = self._session.get(
             url= f'{self.protocol}://{self.host}/{self.DATA_PRODUCT_PATH}/{dp_id}',
             verify=self.verify_ssl,
             **auth_kwargs
         )
         if not response.ok:
             raise Exception('bad request' + str(response))
-        return DataProduct.load(response.json())
+        product = DataProduct.load(response.json())
+        self._product_cache[dp_id] = (time.monotonic(), product)
+        return product
     
 
+    def invalidate_product_cache(self, dp_id: str=None):
+        """Drop cached data product details.
+
+        Args:
+            dp_id (str, optional): ID whose cache entry should be dropped.
+                Defaults to None, which clears the whole cache. Call this
+                after operations that change server-side state the cache
+                cannot see, such as publishing.
+        """
+        if dp_id is None:
+            self._product_cache.clear()
+        else:
+            self._product_cache.pop(dp_id, None)
+
+
     def get_data_product_statistics(self, dp_id: str) -> DataProductStatistics:
         """Get usage statistics for a specific data product.
 
@@ -272,7 +335,7 @@ class Api:
             Exception: If the API request fails
         """
         auth_kwargs = self._get_auth_kwargs()
-        response = requests.get(
+        response = self._session.get(
             url=f'{self.protocol}://{self.host}/{self.DATA_PRODUCT_PATH}/{dp_id}/statistics',
             verify=self.verify_ssl,
             **auth_kwargs
@@ -296,7 +359,7 @@ class Api:
             Exception: If the API request fails
         """
         auth_kwargs = self._get_auth_kwargs()
-        response = requests.put(
+        response = self._session.put(
             url=f'{self.protocol}://{self.host}/{self.DATA_PRODUCT_PATH}/{dp_id}',
             json=data_product.asdict(),
             verify=self.verify_ssl,
@@ -304,21 +367,65 @@ class Api:
         )
         if not response.ok:
             raise Exception(f'Request returned code {response.status_code}.\nResponse body: {response.text}')
-        return DataProduct.load(response.json())
+        product = DataProduct.load(response.json())
+        # The server echoed the final state, so refresh the cache with it
+        self._product_cache[dp_id] = (time.monotonic(), product)
+        return product
     
     
-    def update_sample_queries(self, dp_id: str, sample_queries: List[SampleQuery]):
+    def bulk_update_data_product(
+        self,
+        dp_id: str,
+        data_product: DataProductParameters=None,
+        sample_queries: List[SampleQuery]=None,
+        tags: List[str]=None
+    ) -> Dict[str, Any]:
+        """Apply several updates to a data product in one call.
+
+        The REST API has no combined update endpoint, so this issues the
+        minimal set of underlying requests - one per supplied payload - over
+        the pooled session, with no interleaved read-backs.
+
+        Args:
+            dp_id (str): ID of the data product to update
+            data_product (DataProductParameters, optional): Updated core parameters
+            sample_queries (List[SampleQuery], optional): Sample queries to set
+            tags (List[str], optional): Tag values to set
+
+        Returns:
+            Dict[str, Any]: The results of each performed update, keyed by
+            'dataProduct', 'sampleQueries', and 'tags'
+
+        Raises:
+            Exception: If any underlying API request fails
+        """
+        results = {}
+        if data_product is not None:
+            results['dataProduct'] = self.update_data_product(dp_id, data_product)
+        if sample_queries is not None:
+            results['sampleQueries'] = self.update_sample_queries(dp_id, sample_queries)
+        if tags is not None:
+            results['tags'] = self.update_tags(dp_id, tags)
+        return results
+
+
+    def update_sample_queries(self, dp_id: str, sample_queries: List[SampleQuery]) -> List[SampleQuery]:
         """Update the sample queries for a data product.
 
         Args:
             dp_id (str): ID of the data product
             sample_queries (List[SampleQuery]): List of sample queries to set
 
+        Returns:
+            List[SampleQuery]: The final sample queries, taken from the
+            server's response when it echoes them so no follow-up
+            list_sample_queries call is needed
+
         Raises:
             Exception: If the API request fails
         """
         auth_kwargs = self._get_auth_kwargs()
-        response = requests.put(
+        response = self._session.put(
             url=f'{self.protocol}://{self.host}/{self.DATA_PRODUCT_PATH}/{dp_id}/sampleQueries',
             json=[{'name':query.name,'description':query.description,'query':query.query} for query in sample_queries],
             verify=self.verify_ssl,
@@ -326,6 +433,14 @@ class Api:
         )
         if not response.ok:
             raise Exception(f'Request returned code {response.status_code}.\nResponse body: {response.text}')
+        # The endpoint replaces the whole list, so the submitted queries are
+        # the final state even when the response body is empty
+        if response.content:
+            try:
+                return [SampleQuery.load(result) for result in response.json()]
+            except ValueError:
+                pass
+        return list(sample_queries)
     
     
     def list_sample_queries(self, dp_id: str) -> List[SampleQuery]:
@@ -341,7 +456,7 @@ class Api:
             Exception: If the API request fails
         """
         auth_kwargs = self._get_auth_kwargs()
-        response = requests.get(
+        response = self._session.get(
             url=f'{self.protocol}://{self.host}/{self.DATA_PRODUCT_PATH}/{dp_id}/sampleQueries',
             verify=self.verify_ssl,
             **auth_kwargs
@@ -365,7 +480,7 @@ class Api:
             Exception: If the API request fails
         """
         auth_kwargs = self._get_auth_kwargs()
-        response = requests.get(
+        response = self._session.get(
             url=f'{self.protocol}://{self.host}/{self.DATA_PRODUCT_PATH}/{dp_id}/materializedViews/{view_name}/refreshMetadata',
             verify=self.verify_ssl,
             **auth_kwargs
@@ -394,7 +509,7 @@ class Api:
             Exception: If the API request fails
         """
         auth_kwargs = self._get_auth_kwargs()
-        response = requests.post(
+        response = self._session.post(
             url=f'{self.protocol}://{self.host}/{self.DOMAIN_PATH}',
             json={
                 'name': name,
@@ -419,7 +534,7 @@ class Api:
             Exception: If the API request fails
         """
         auth_kwargs = self._get_auth_kwargs()
-        response = requests.delete(
+        response = self._session.delete(
             url=f'{self.protocol}://{self.host}/{self.DOMAIN_PATH}/{domain_id}',
             verify=self.verify_ssl,
             **auth_kwargs
@@ -443,7 +558,7 @@ class Api:
             Exception: If the API request fails
         """
         auth_kwargs = self._get_auth_kwargs()
-        response = requests.put(
+        response = self._session.put(
             url=f'{self.protocol}://{self.host}/{self.DOMAIN_PATH}/{domain_id}',
             json={
                 'description': description,
@@ -467,7 +582,7 @@ class Api:
             Exception: If the API request fails
         """
         auth_kwargs = self._get_auth_kwargs()
-        response = requests.get(
+        response = self._session.get(
             url=f'{self.protocol}://{self.host}/{self.DOMAIN_PATH}',
             verify=self.verify_ssl,
             **auth_kwargs
@@ -490,7 +605,7 @@ class Api:
             Exception: If the API request fails
         """
         auth_kwargs = self._get_auth_kwargs()
-        response = requests.get(
+        response = self._session.get(
             url= f'{self.protocol}://{self.host}/{self.DOMAIN_PATH}/{domain_id}',
             verify=self.verify_ssl,
             **auth_kwargs
@@ -515,7 +630,7 @@ class Api:
             Exception: If the API request fails
         """
         auth_kwargs = self._get_auth_kwargs()
-        response = requests.put(
+        response = self._session.put(
             url=f'{self.protocol}://{self.host}/{self.DATA_PRODUCT_TAGS_PATH}/products/{dp_id}',
             json=[{"value": val} for val in tag_values],
             verify=self.verify_ssl,
@@ -526,6 +641,53 @@ class Api:
         return [Tag.load(result) for result in response.json()]
         
         
+    def add_tags(self, dp_id: str, tag_values: List[str]) -> List[Tag]:
+        """Add tags to a data product, keeping its existing tags.
+
+        The tags endpoint only supports replacing the whole list, so this
+        reads the current tags, unions in the new values (preserving order
+        and dropping duplicates) and writes the result back - two round
+        trips instead of the read/modify/write/verify sequence callers
+        would otherwise issue themselves.
+
+        Args:
+            dp_id (str): ID of the data product
+            tag_values (List[str]): Tag values to add
+
+        Returns:
+            List[Tag]: The resulting tags on the data product
+
+        Raises:
+            Exception: If the API request fails
+        """
+        current_values = [tag.value for tag in self.get_tags(dp_id)]
+        merged = list(dict.fromkeys(current_values + list(tag_values)))
+        return self.update_tags(dp_id, merged)
+
+
+    def list_tags(self) -> List[Tag]:
+        """List all tags defined in the system, across all data products.
+
+        One round trip against the tags collection endpoint; includes tags
+        that are not currently assigned to any data product.
+
+        Returns:
+            List[Tag]: List of all tags
+
+        Raises:
+            Exception: If the API request fails
+        """
+        auth_kwargs = self._get_auth_kwargs()
+        response = self._session.get(
+            url=f'{self.protocol}://{self.host}/{self.DATA_PRODUCT_TAGS_PATH}',
+            verify=self.verify_ssl,
+            **auth_kwargs
+        )
+        if not response.ok:
+            raise Exception(f'Request returned code {response.status_code}.\nResponse body: {response.text}')
+        return [Tag.load(result) for result in response.json()]
+
+
     def get_tags(self, dp_id: str) -> List[Tag]:
         """Get tags for a data product.
 
@@ -539,7 +701,7 @@ class Api:
             Exception: If the API request fails
         """
         auth_kwargs = self._get_auth_kwargs()
-        response = requests.get(
+        response = self._session.get(
             url=f'{self.protocol}://{self.host}/{self.DATA_PRODUCT_TAGS_PATH}/products/{dp_id}',
             verify=self.verify_ssl,
             **auth_kwargs
@@ -560,7 +722,7 @@ class Api:
             Exception: If the API request fails
         """
         auth_kwargs = self._get_auth_kwargs()
-        response = requests.delete(
+        response = self._session.delete(
             url=f'{self.protocol}://{self.host}/{self.DATA_PRODUCT_TAGS_PATH}/{tag_id}/products/{dp_id}',
             verify=self.verify_ssl,
             **auth_kwargs
@@ -581,7 +743,7 @@ class Api:
             Exception: If the API request fails
         """
         auth_kwargs = self._get_auth_kwargs()
-        response = requests.post(
+        response = self._session.post(
             url=f'{self.protocol}://{self.host}/{self.DATA_PRODUCT_PATH}/{dp_id}/workflows/publish',
             params={'force': force},
             verify=self.verify_ssl,
@@ -589,11 +751,18 @@ class Api:
         )
         if not response.ok:
             raise Exception(f'Request returned code {response.status_code}.\nResponse body: {response.text}')
+        # The workflow changes the product's status server-side; drop any
+        # cached snapshot so get_data_product reflects it
+        self.invalidate_product_cache(dp_id)
     
 
     def get_publish_data_product_status(self, dp_id: str) -> DataProductWorkflowStatus:
         """Get the status of a data product publish workflow.
 
+        The response is already minimal - just workflowType, status,
+        errors and isFinalStatus - so polling it repeatedly carries no
+        excess payload and no field projection is needed.
+
         Args:
             dp_id (str): ID of the data product
 
@@ -604,7 +773,7 @@ class Api:
             Exception: If the API request fails
         """
         auth_kwargs = self._get_auth_kwargs()
-        response = requests.get(
+        response = self._session.get(
             url=f'{self.protocol}://{self.host}/{self.DATA_PRODUCT_PATH}/{dp_id}/workflows/publish',
             verify=self.verify_ssl,
             **auth_kwargs
@@ -629,7 +798,7 @@ class Api:
             Exception: If the API request fails
         """
         auth_kwargs = self._get_auth_kwargs()
-        response = requests.post(
+        response = self._session.post(
             url=f'{self.protocol}://{self.host}/{self.DATA_PRODUCT_PATH}/{dp_id}/workflows/delete',
             params={'skipTrinoDelete': skip_objects_delete},
             verify=self.verify_ssl,
@@ -637,6 +806,9 @@ class Api:
         )
         if not response.ok:
             raise Exception(f'Request returned code {response.status_code}.\nResponse body: {response.text}')
+        # A deleted product must not be served from cache; the next
+        # get_data_product should surface the server's 404
+        self.invalidate_product_cache(dp_id)
     
 
     def get_delete_data_product_status(self, dp_id: str) -> DataProductWorkflowStatus:
@@ -652,7 +824,7 @@ class Api:
             Exception: If the API request fails
         """
         auth_kwargs = self._get_auth_kwargs()
-        response = requests.get(
+        response = self._session.get(
             url=f'{self.protocol}://{self.host}/{self.DATA_PRODUCT_PATH}/{dp_id}/workflows/delete',
             verify=self.verify_ssl,
             **auth_kwargs
@@ -34,6 +34,7 @@ For Kerberos authentication:
 - KERBEROS_PRINCIPAL: Kerberos principal (optional)
 """
 
+import functools
 import os
 import warnings
 from typing import Dict, Any, Optional, Tuple
@@ -45,6 +46,20 @@ class AuthenticationError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=None)
+def load_env_file(env_file: Optional[str] = None) -> bool:
+    """Parse the given .env file once per process.
+
+    Helpers such as get_auth_info and create_api_client each build an
+    AuthConfig, so without this cache the same file would be re-read and
+    re-parsed on every call. Example scripts that need the environment
+    loaded without building a client can call this directly.
+    """
+    if env_file:
+        return load_dotenv(env_file)
+    return load_dotenv()
+
+
 class AuthConfig:
     """Centralized authentication configuration."""
     
@@ -56,10 +71,7 @@ class AuthConfig:
         Args:
             env_file: Path to .env file. If None, uses default .env discovery.
         """
-        if env_file:
-            load_dotenv(env_file)
-        else:
-            load_dotenv()
+        load_env_file(env_file)
         
         self.method = self._get_auth_method()
         self.host = self._get_required_env('SEP_HOST', 'Starburst host')
@@ -296,6 +308,24 @@ def create_api_client_with_messages(env_file: Optional[str] = None):
     return api
 
 
+def validate_config(env_file: Optional[str] = None) -> None:
+    """Validate authentication configuration without connecting.
+
+    Builds the full set of API constructor arguments - which checks the
+    host format, the authentication method and the presence of its
+    credentials - so misconfiguration is reported before any TCP/TLS
+    handshake is attempted.
+
+    Args:
+        env_file: Path to .env file. If None, uses default .env discovery.
+
+    Raises:
+        AuthenticationError: If authentication configuration is invalid
+        ImportError: If required authentication library is not available
+    """
+    AuthConfig(env_file).get_api_kwargs()
+
+
 def get_auth_info(env_file: Optional[str] = None) -> Dict[str, Any]:
     """Get authentication configuration information.
     
@@ -6,6 +6,12 @@ except ImportError:
 import marshmallow_dataclass
 from dataclasses import asdict, is_dataclass
 from json import JSONEncoder, dumps
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 from datetime import datetime
 from functools import singledispatchmethod
 from dataclasses import dataclass
@@ -51,6 +57,10 @@ class JsonDataClass:
             raise NotImplemented('Only dataclasses should inherit from JsonDataClass!')
 
     def to_json(self) -> str:
+        # orjson serializes datetimes natively (ISO 8601, same shape as
+        # DateTimeEncoder) and is considerably faster than stdlib json
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self.asdict()).decode()
         return dumps(self.asdict(), cls=DateTimeEncoder)
 
 
@@ -149,6 +149,77 @@ class TestSepDataProducts:
         self.sep_api.delete_domain(domain.id)
 
 
+    def test_add_and_list_tags(self):
+        domain = self.sep_api.create_domain('dpdomain')
+        created_data_product = self.sep_api.create_data_product(
+            self.create_data_product_obj(
+                'dptest',
+                'hive',
+                'dptest',
+                'this is a summary',
+                domain.id
+            )
+        )
+        assert created_data_product.name == 'dptest'
+        # set an initial tag, then add more without replacing it
+        self.sep_api.update_tags(created_data_product.id, ['saoirse'])
+        tags = self.sep_api.add_tags(created_data_product.id, ['saoirse', 'niamh'])
+        tag_values = [tag.value for tag in tags]
+        assert tag_values == ['saoirse', 'niamh']
+        # the system-wide tag listing includes both
+        all_tag_values = [tag.value for tag in self.sep_api.list_tags()]
+        assert 'saoirse' in all_tag_values
+        assert 'niamh' in all_tag_values
+        for tag in tags:
+            self.sep_api.delete_tag(tag.id, created_data_product.id)
+        tags = self.sep_api.get_tags(created_data_product.id)
+        assert len(tags) == 0
+        self.delete_data_product(created_data_product.id)
+        self.sep_api.delete_domain(domain.id)
+
+
+    def test_bulk_update_data_product(self):
+        domain = self.sep_api.create_domain('dpdomain')
+        created_data_product = self.sep_api.create_data_product(
+            self.create_data_product_obj(
+                'dptest',
+                'hive',
+                'dptest',
+                'this is a summary',
+                domain.id
+            )
+        )
+        assert created_data_product.name == 'dptest'
+        updated_params = self.create_data_product_obj(
+            'dptest',
+            'hive',
+            'dptest',
+            'this is an updated summary',
+            domain.id
+        )
+        results = self.sep_api.bulk_update_data_product(
+            created_data_product.id,
+            data_product=updated_params,
+            sample_queries=[SampleQuery(name='first', description='first description', query='select * from tpch.sf1.region')],
+            tags=['saoirse']
+        )
+        assert results['dataProduct'].summary == 'this is an updated summary'
+        assert len(results['sampleQueries']) == 1
+        assert results['sampleQueries'][0].name == 'first'
+        assert len(results['tags']) == 1
+        assert results['tags'][0].value == 'saoirse'
+        # verify each update landed server-side
+        fetched_data_product = self.sep_api.get_data_product(created_data_product.id)
+        assert fetched_data_product.summary == 'this is an updated summary'
+        dp_sample_queries = self.sep_api.list_sample_queries(created_data_product.id)
+        assert len(dp_sample_queries) == 1
+        tags = self.sep_api.get_tags(created_data_product.id)
+        assert len(tags) == 1
+        self.sep_api.delete_tag(tags[0].id, created_data_product.id)
+        self.delete_data_product(created_data_product.id)
+        self.sep_api.delete_domain(domain.id)
+
+
     def test_publish_data_product(self):
         domain = self.sep_api.create_domain('dpdomain')
         tpch_views = [